@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, Tuple
+import math
+from collections import defaultdict, deque
+from functools import partial
+from operator import attrgetter
+from types import MappingProxyType
+from typing import AbstractSet, Callable, Collection, DefaultDict, Dict, FrozenSet, Iterator, List, Mapping, Optional, Set, Tuple
 
 from .components import CircuitComponent
 from .wires import CircuitWire
@@ -8,20 +13,41 @@ from .wires import CircuitWire
 AnalysisDict = Dict[str, object]
 ComponentMetrics = Dict[CircuitComponent, Dict[str, float]]
 Adjacency = Dict[CircuitComponent, Set[CircuitComponent]]
-
-PASSIVE_LOAD_TYPES: Set[str] = {
-    "resistor",
-    "bulb",
-    "diode",
-    "ammeter",
-    "voltmeter",
+ComponentValues = Dict[CircuitComponent, float]
+AnalysisResult = Tuple[AnalysisDict, Optional[List[CircuitComponent]], Optional[List[CircuitWire]], ComponentMetrics]
+PathBuilder = Optional[Callable[[], str]]
+
+_component_id = attrgetter("id")
+
+_EMPTY_ANALYSIS_TEMPLATE: AnalysisDict = {
+    "component_count": 0,
+    "wire_count": 0,
+    "active_component_count": 0,
+    "active_wire_count": 0,
+    "type": "Open",
+    "status": "Open",
+    "status_detail": "⚫ Open Circuit",
+    "total_voltage": 0.0,
+    "total_current": 0.0,
+    "total_resistance": 0.0,
+    "total_power": 0.0,
+    "path_description": "—",
+    "issues": [],
 }
 
-TERMINAL_REQUIREMENTS: Dict[str, int] = {
+TERMINAL_REQUIREMENTS: Mapping[str, int] = MappingProxyType({
     "ground": 1,
-}
+})
+
+SWITCH_TYPES: FrozenSet[str] = frozenset({"switch", "switch_spst", "switch_spdt"})
+_is_switch_type = SWITCH_TYPES.__contains__
 
-SWITCH_TYPES: Set[str] = {"switch", "switch_spst", "switch_spdt"}
+TERMINAL_SIDE_SLOTS: Mapping[str, int] = MappingProxyType({
+    "left": 0,
+    "right": 1,
+    "top": 2,
+    "bottom": 3,
+})
 
 
 def expected_connections(component: CircuitComponent) -> int:
@@ -29,57 +55,111 @@ def expected_connections(component: CircuitComponent) -> int:
     return TERMINAL_REQUIREMENTS.get(component.type, 2)
 
 
-def _is_passive_load(component: CircuitComponent) -> bool:
-    # Check whether the component should behave like a passive load in analysis.
-    if component.type in PASSIVE_LOAD_TYPES:
-        return component.get_resistance() > 0
-    if component.type == "battery":
-        return False
-    resistance = component.get_resistance()
-    return resistance > 0
-
-
-def _is_switch(component: CircuitComponent) -> bool:
-    # Determine if the component is treated as a switch.
-    return component.type in SWITCH_TYPES
+def _find(parents: List[int], node: int) -> int:
+    # Locate the set representative iteratively, compressing the walked path onto it.
+    root = node
+    while parents[root] != root:
+        root = parents[root]
+    while parents[node] != root:
+        parents[node], node = root, parents[node]
+    return root
+
+
+def _union(parents: List[int], rank: List[int], a: int, b: int) -> None:
+    # Merge two disjoint sets, hanging the shallower tree beneath the deeper one.
+    root_a = _find(parents, a)
+    root_b = _find(parents, b)
+    if root_a == root_b:
+        return
+    if rank[root_a] < rank[root_b]:
+        root_a, root_b = root_b, root_a
+    parents[root_b] = root_a
+    if rank[root_a] == rank[root_b]:
+        rank[root_a] += 1
+
+
+def _flatten(parents: List[int]) -> List[int]:
+    # Point every entry straight at its representative so later lookups are plain indexing.
+    for node in range(len(parents)):
+        parents[node] = _find(parents, node)
+    return parents
+
+
+def _component_role(component: CircuitComponent, resistances: ComponentValues) -> str:
+    # Classify the component's part in the analysis so later passes can consult one lookup.
+    component_type = component.type
+    if component_type == "battery":
+        return "battery"
+    is_switch = _is_switch_type(component_type)
+    if is_switch and not getattr(component, "switch_closed", True):
+        return "switch_open"
+    if resistances[component] > 0.0:
+        return "load"
+    if is_switch:
+        return "switch_closed"
+    return "other"
+
+
+def _component_issues(
+    components: List[CircuitComponent],
+    endpoint_counts: List[int],
+    required_connections: List[int],
+    roles: List[str],
+) -> Iterator[str]:
+    # Yield terminal and open-switch warnings in component order, formatting only the ones raised.
+    for component, connected, required, role in zip(components, endpoint_counts, required_connections, roles):
+        if connected < required:
+            yield f"{component.display_label}: {connected}/{required} terminals connected"
+        if role == "switch_open":
+            yield f"{component.display_label} is open; close it to complete the circuit"
 
 
-def _is_switch_closed(component: CircuitComponent) -> bool:
-    # Inspect a switch component to see if its contacts are closed.
-    if not _is_switch(component):
-        return True
-    return getattr(component, "switch_closed", True)
+def _group_adjacency(
+    component_group: List[CircuitComponent],
+    components: List[CircuitComponent],
+    component_nodes: Dict[CircuitComponent, List[int]],
+    node_members: Dict[int, Set[int]],
+) -> Adjacency:
+    # Link each component of a connected group to every component sharing one of its nodes.
+    adjacency: Adjacency = {}
+    for component in component_group:
+        neighbor_indices: Set[int] = set()
+        for node_id in component_nodes.get(component, []):
+            neighbor_indices.update(node_members[node_id])
+        neighbors = {components[idx] for idx in neighbor_indices}
+        neighbors.discard(component)
+        adjacency[component] = neighbors
+    return adjacency
 
 
 def classify_circuit(
     component_group: List[CircuitComponent],
     adjacency: Adjacency,
     loads: List[CircuitComponent],
-    component_nodes: Optional[Dict[CircuitComponent, List[str]]] = None,
+    component_nodes: Optional[Dict[CircuitComponent, List[int]]] = None,
 ) -> str:
     # Infer whether the connected group functions as series, parallel, or single load.
     if len(loads) <= 1:
         return "Single Load"
 
     if component_nodes:
-        node_pair_counts: Dict[Tuple[str, str], int] = {}
+        node_pair_counts: DefaultDict[Tuple[int, int], int] = defaultdict(int)
         for load in loads:
             nodes = sorted({node for node in component_nodes.get(load, []) if node is not None})
             if len(nodes) >= 2:
                 pair = (nodes[0], nodes[1])
-                node_pair_counts[pair] = node_pair_counts.get(pair, 0) + 1
-        if any(count >= 2 for count in node_pair_counts.values()):
-            return "Parallel"
+                node_pair_counts[pair] += 1
+                if node_pair_counts[pair] >= 2:
+                    return "Parallel"
 
-    branch_nodes = [comp for comp in component_group if len(adjacency.get(comp, set())) > 2]
-    if branch_nodes:
+    if any(len(adjacency.get(comp, ())) > 2 for comp in component_group):
         return "Parallel"
 
     return "Series"
 
 
 def describe_active_path(
-    component_group: List[CircuitComponent],
+    component_group: Collection[CircuitComponent],
     adjacency: Adjacency,
     batteries: List[CircuitComponent],
 ) -> str:
@@ -87,25 +167,29 @@ def describe_active_path(
     if not component_group:
         return "—"
 
-    start = batteries[0] if batteries else component_group[0]
-    visited: Set[CircuitComponent] = set()
-    queue: List[CircuitComponent] = [start]
+    start = batteries[0] if batteries else next(iter(component_group))
+    group_members = component_group if isinstance(component_group, AbstractSet) else frozenset(component_group)
+    sorted_neighbors: Dict[CircuitComponent, List[CircuitComponent]] = {
+        node: sorted((neighbor for neighbor in neighbors if neighbor in group_members), key=_component_id)
+        for node, neighbors in adjacency.items()
+        if node in group_members
+    }
+    visited: Set[CircuitComponent] = {start}
+    queue = deque((start,))
     ordered: List[str] = []
+    sorted_neighbors_get = sorted_neighbors.get
+    visited_add = visited.add
+    enqueue = queue.append
+    dequeue = queue.popleft
 
     while queue:
-        node = queue.pop(0)
-        if node in visited:
-            continue
-        visited.add(node)
+        node = dequeue()
         ordered.append(node.code_label)
 
-        neighbors = sorted(
-            (neighbor for neighbor in adjacency.get(node, set()) if neighbor in component_group),
-            key=lambda comp: comp.id,
-        )
-        for neighbor in neighbors:
+        for neighbor in sorted_neighbors_get(node, ()):
             if neighbor not in visited:
-                queue.append(neighbor)
+                visited_add(neighbor)
+                enqueue(neighbor)
 
     return " → ".join(ordered) if ordered else "—"
 
@@ -115,10 +199,17 @@ def compute_circuit_metrics(
     batteries: List[CircuitComponent],
     loads: List[CircuitComponent],
     circuit_type: str,
+    resistances: Optional[ComponentValues] = None,
+    voltages: Optional[ComponentValues] = None,
 ) -> tuple[AnalysisDict, ComponentMetrics, List[str]]:
     # Calculate aggregate and per-component electrical metrics for the active circuit.
+    if resistances is None:
+        resistances = {comp: comp.get_resistance() for comp in loads}
+    if voltages is None:
+        voltages = {battery: battery.get_voltage() for battery in batteries}
+
     summary: AnalysisDict = {
-        "total_voltage": sum(component.get_voltage() for component in batteries),
+        "total_voltage": math.fsum(voltages[battery] for battery in batteries),
         "total_resistance": 0.0,
         "total_current": 0.0,
         "total_power": 0.0,
@@ -141,8 +232,14 @@ def compute_circuit_metrics(
         summary["status_detail_override"] = "⚠️ Add a resistor, bulb, or other load"
         return summary, per_component, issues
 
-    positive_loads = [comp for comp in loads if comp.get_resistance() > 0]
-    zero_loads = [comp for comp in loads if comp.get_resistance() <= 0]
+    positive_loads: List[Tuple[CircuitComponent, float]] = []
+    zero_loads: List[CircuitComponent] = []
+    for comp in loads:
+        resistance = resistances[comp]
+        if resistance > 0:
+            positive_loads.append((comp, resistance))
+        else:
+            zero_loads.append(comp)
     if zero_loads:
         for comp in zero_loads:
             issues.append(f"{comp.display_label} has zero resistance (short path)")
@@ -152,33 +249,37 @@ def compute_circuit_metrics(
         return summary, per_component, issues
 
     if circuit_type == "Parallel" and len(positive_loads) >= 2:
-        inverse_sum = sum(1.0 / comp.get_resistance() for comp in positive_loads if comp.get_resistance() > 0)
+        inverse_sum = 0.0
+        branch_metrics: ComponentMetrics = {}
+
+        for comp, resistance in positive_loads:
+            conductance = 1.0 / resistance
+            branch_current = total_voltage * conductance
+            branch_power = total_voltage * branch_current
+            inverse_sum += conductance
+            branch_metrics[comp] = {
+                "current": branch_current,
+                "voltage": total_voltage,
+                "power": branch_power,
+            }
+
         if inverse_sum <= 0:
             issues.append("Unable to compute equivalent resistance for parallel network")
             summary["status_override"] = "Alert"
             summary["status_detail_override"] = "⚠️ Calculation error"
             return summary, per_component, issues
-        equivalent_resistance = 1.0 / inverse_sum
-        total_current = sum(total_voltage / comp.get_resistance() for comp in positive_loads)
-        total_power = sum((total_voltage ** 2) / comp.get_resistance() for comp in positive_loads)
 
-        summary["total_resistance"] = equivalent_resistance
+        # Every branch sees the full source voltage, so the totals follow from the conductance sum.
+        total_current = total_voltage * inverse_sum
+        per_component.update(branch_metrics)
+        summary["total_resistance"] = 1.0 / inverse_sum
         summary["total_current"] = total_current
-        summary["total_power"] = total_power
-
-        for comp in positive_loads:
-            branch_current = total_voltage / comp.get_resistance()
-            branch_power = (total_voltage ** 2) / comp.get_resistance()
-            per_component[comp] = {
-                "current": branch_current,
-                "voltage": total_voltage,
-                "power": branch_power,
-            }
+        summary["total_power"] = total_voltage * total_current
     else:
         if circuit_type not in ("Series", "Single Load"):
             issues.append("Circuit contains mixed branches; using series approximation")
 
-        equivalent_resistance = sum(comp.get_resistance() for comp in positive_loads)
+        equivalent_resistance = sum(resistance for _, resistance in positive_loads)
         if equivalent_resistance <= 0:
             issues.append("Equivalent resistance is zero; cannot compute current")
             summary["status_override"] = "Alert"
@@ -187,231 +288,262 @@ def compute_circuit_metrics(
 
         total_current = total_voltage / equivalent_resistance
         total_power = total_voltage * total_current
+        current_squared = total_current * total_current
 
         summary["total_resistance"] = equivalent_resistance
         summary["total_current"] = total_current
         summary["total_power"] = total_power
 
-        for comp in positive_loads:
-            voltage_drop = total_current * comp.get_resistance()
-            branch_power = total_current ** 2 * comp.get_resistance()
+        for comp, resistance in positive_loads:
             per_component[comp] = {
                 "current": total_current,
-                "voltage": voltage_drop,
-                "power": branch_power,
+                "voltage": total_current * resistance,
+                "power": current_squared * resistance,
             }
 
-    for battery in batteries:
-        per_component[battery] = {
-            "current": summary["total_current"],
-            "voltage": battery.get_voltage(),
-            "power": battery.get_voltage() * summary["total_current"],
-        }
-
+    group_current = summary["total_current"]
+    # Only the listed batteries get a source record; any other group member the load pass skipped gets the default.
+    battery_set = set(batteries)
     for component in component_group:
-        per_component.setdefault(component, {
-            "current": summary["total_current"],
-            "voltage": 0.0,
-            "power": 0.0,
-        })
+        if component in battery_set:
+            battery_voltage = voltages[component]
+            per_component[component] = {
+                "current": group_current,
+                "voltage": battery_voltage,
+                "power": battery_voltage * group_current,
+            }
+        elif component not in per_component:
+            per_component[component] = {
+                "current": group_current,
+                "voltage": 0.0,
+                "power": 0.0,
+            }
 
     return summary, per_component, issues
 
 
-def analyze_circuit(
+def circuit_signature(
     components: List[CircuitComponent],
     wires: List[CircuitWire],
-) -> tuple[AnalysisDict, Optional[List[CircuitComponent]], Optional[List[CircuitWire]], ComponentMetrics]:
-    # Evaluate circuit connectivity and electrical characteristics from components and wires.
-    analysis: AnalysisDict = {
-        "component_count": len(components),
-        "wire_count": len(wires),
-        "active_component_count": 0,
-        "active_wire_count": 0,
-        "type": "Open",
-        "status": "Open",
-        "status_detail": "⚫ Open Circuit",
-        "total_voltage": 0.0,
-        "total_current": 0.0,
-        "total_resistance": 0.0,
-        "total_power": 0.0,
-        "path_description": "—",
-        "issues": [],
-    }
+    resistances: Optional[ComponentValues] = None,
+    voltages: Optional[ComponentValues] = None,
+) -> Tuple:
+    # Capture every input the analysis reads so an unchanged circuit maps to the same key; geometry is left out.
+    if resistances is None:
+        resistances = {component: component.get_resistance() for component in components}
+    if voltages is None:
+        voltages = {component: component.get_voltage() for component in components if component.type == "battery"}
+    return (
+        tuple(
+            (
+                component,
+                component.type,
+                component.display_label,
+                resistances[component],
+                voltages.get(component),
+                getattr(component, "switch_closed", True),
+            )
+            for component in components
+        ),
+        tuple(
+            (
+                wire,
+                tuple(wire.attachments.items()),
+                tuple((point_id, frozenset(link_set)) for point_id, link_set in wire.links.items()),
+            )
+            for wire in wires
+        ),
+    )
+
 
+def analyze_circuit(
+    components: List[CircuitComponent],
+    wires: List[CircuitWire],
+    describe_path: bool = True,
+) -> AnalysisResult:
+    # Evaluate circuit connectivity and electrical characteristics.
+    # The display-only path description is built only when asked for; pass describe_path=False to skip it.
     for component in components:
         component.reset_operating_metrics()
 
-    def _find_root(parents: Dict[int, int], node: int) -> int:
-        parents.setdefault(node, node)
-        if parents[node] != node:
-            parents[node] = _find_root(parents, parents[node])
-        return parents[node]
-
-    def _union_nodes(parents: Dict[int, int], a: int, b: int) -> None:
-        root_a = _find_root(parents, a)
-        root_b = _find_root(parents, b)
-        if root_a != root_b:
-            parents[root_b] = root_a
-
-    def _find_terminal_root(parents: Dict[str, str], terminal: str) -> str:
-        parents.setdefault(terminal, terminal)
-        if parents[terminal] != terminal:
-            parents[terminal] = _find_terminal_root(parents, parents[terminal])
-        return parents[terminal]
-
-    def _union_terminals(parents: Dict[str, str], a: str, b: str) -> None:
-        root_a = _find_terminal_root(parents, a)
-        root_b = _find_terminal_root(parents, b)
-        if root_a != root_b:
-            parents[root_b] = root_a
-
-    adjacency: Adjacency = {component: set() for component in components}
-    endpoint_counts: Dict[CircuitComponent, int] = {component: 0 for component in components}
+    resistances: ComponentValues = {component: component.get_resistance() for component in components}
+    voltages: ComponentValues = {
+        component: component.get_voltage() for component in components if component.type == "battery"
+    }
+
+    (analysis, active_group, active_wires, component_metrics), path_builder = _analyze_circuit(
+        components, wires, resistances, voltages
+    )
+    if describe_path and path_builder is not None:
+        analysis["path_description"] = path_builder()
+    return analysis, active_group, active_wires, component_metrics
+
+
+def _analyze_circuit(
+    components: List[CircuitComponent],
+    wires: List[CircuitWire],
+    resistances: ComponentValues,
+    voltages: ComponentValues,
+) -> Tuple[AnalysisResult, PathBuilder]:
+    # Walk the wiring, find the first energizable group and compute its metrics.
+    analysis: AnalysisDict = _EMPTY_ANALYSIS_TEMPLATE.copy()
+    analysis["component_count"] = len(components)
+    analysis["wire_count"] = len(wires)
+    issues: List[str] = []
+    analysis["issues"] = issues
+    issues_append = issues.append
+
+    roles: List[str] = [_component_role(component, resistances) for component in components]
+    present_roles = set(roles)
+    can_energize = "battery" in present_roles and "load" in present_roles
+
+    component_index: Dict[CircuitComponent, int] = {component: idx for idx, component in enumerate(components)}
+    component_index_get = component_index.get
+    endpoint_counts: List[int] = [0] * len(components)
 
     wire_indices: Dict[CircuitWire, int] = {wire: idx for idx, wire in enumerate(wires)}
-    wire_parents: Dict[int, int] = {idx: idx for idx in wire_indices.values()}
+    wire_parents: List[int] = list(range(len(wires)))
+    wire_rank: List[int] = [0] * len(wires)
+    wire_indices_get = wire_indices.get
 
-    for wire in wires:
-        wire_idx = wire_indices[wire]
+    for wire_idx, wire in enumerate(wires):
+        connection_count = 0
         for link_set in wire.links.values():
+            connection_count += len(link_set)
+            if not can_energize:
+                continue
             for linked_wire, _ in link_set:
-                if linked_wire in wire_indices:
-                    _union_nodes(wire_parents, wire_idx, wire_indices[linked_wire])
-
-        attachments_count = sum(1 for attachment in wire.attachments.values() if attachment)
-        linked_count = sum(len(link) for link in wire.links.values())
-        if attachments_count + linked_count == 0:
-            analysis["issues"].append("Wire with no connections detected")
-        elif attachments_count + linked_count == 1:
-            analysis["issues"].append("Wire with a floating endpoint detected")
+                linked_idx = wire_indices_get(linked_wire)
+                if linked_idx is not None:
+                    _union(wire_parents, wire_rank, wire_idx, linked_idx)
 
         for attachment in wire.attachments.values():
             if attachment:
-                comp, _ = attachment
-                endpoint_counts[comp] = endpoint_counts.get(comp, 0) + 1
-
-    wire_clusters: Dict[int, Set[CircuitWire]] = {}
-    wire_cluster_lookup: Dict[CircuitWire, int] = {}
-    for wire, idx in wire_indices.items():
-        root = _find_root(wire_parents, idx)
-        wire_clusters.setdefault(root, set()).add(wire)
-        wire_cluster_lookup[wire] = root
-
-    terminal_parents: Dict[str, str] = {}
-    terminal_component: Dict[str, CircuitComponent] = {}
-    cluster_components: Dict[int, Set[CircuitComponent]] = {}
-
-    for cluster_id, cluster_wires in wire_clusters.items():
-        terminals: List[str] = []
-        component_set: Set[CircuitComponent] = set()
-        for wire in cluster_wires:
-            for attachment in wire.attachments.values():
-                if not attachment:
-                    continue
-                comp, side = attachment
-                terminal_id = f"{comp.id}:{side}"
-                terminals.append(terminal_id)
-                terminal_component[terminal_id] = comp
-                component_set.add(comp)
-        cluster_components[cluster_id] = component_set
-        if len(terminals) >= 2:
-            base = terminals[0]
-            for terminal in terminals[1:]:
-                _union_terminals(terminal_parents, base, terminal)
-        elif len(terminals) == 1:
-            _find_terminal_root(terminal_parents, terminals[0])
-
-    node_members: Dict[str, Set[CircuitComponent]] = {}
-    component_nodes: Dict[CircuitComponent, List[str]] = {component: [] for component in components}
-
-    for terminal_id, component in terminal_component.items():
-        node_id = _find_terminal_root(terminal_parents, terminal_id)
-        node_members.setdefault(node_id, set()).add(component)
-        nodes = component_nodes.setdefault(component, [])
-        if node_id not in nodes:
-            nodes.append(node_id)
-
-    for node_id, comps in node_members.items():
-        comp_list = list(comps)
-        for i in range(len(comp_list)):
-            for j in range(i + 1, len(comp_list)):
-                comp_a = comp_list[i]
-                comp_b = comp_list[j]
-                adjacency.setdefault(comp_a, set()).add(comp_b)
-                adjacency.setdefault(comp_b, set()).add(comp_a)
-
-    for component in components:
-        connected = endpoint_counts.get(component, 0)
-        required = expected_connections(component)
-        if connected < required:
-            analysis["issues"].append(f"{component.display_label}: {connected}/{required} terminals connected")
-        if _is_switch(component) and not _is_switch_closed(component):
-            analysis["issues"].append(f"{component.display_label} is open; close it to complete the circuit")
-
-    visited: Set[CircuitComponent] = set()
-    active_group: Optional[List[CircuitComponent]] = None
-    group_batteries: List[CircuitComponent] = []
-    group_loads: List[CircuitComponent] = []
+                connection_count += 1
+                comp_idx = component_index_get(attachment[0])
+                if comp_idx is not None:
+                    endpoint_counts[comp_idx] += 1
 
-    for component in components:
-        if component in visited:
-            continue
+        if connection_count == 0:
+            issues_append("Wire with no connections detected")
+        elif connection_count == 1:
+            issues_append("Wire with a floating endpoint detected")
 
-        stack = [component]
-        visited.add(component)
-        candidate_group: List[CircuitComponent] = []
+    required_connections: List[int] = [expected_connections(component) for component in components]
+    issues.extend(_component_issues(components, endpoint_counts, required_connections, roles))
 
-        while stack:
-            node = stack.pop()
-            candidate_group.append(node)
-            for neighbor in adjacency.get(node, set()):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
+    if not can_energize:
+        return (analysis, None, None, {}), None
 
-        if len(candidate_group) < 2:
-            continue
+    slot_count = len(TERMINAL_SIDE_SLOTS)
 
-        batteries = [comp for comp in candidate_group if comp.type == "battery"]
-        loads = [comp for comp in candidate_group if _is_passive_load(comp)]
+    cluster_terminals: DefaultDict[int, List[int]] = defaultdict(list)
+    cluster_components: DefaultDict[int, Set[CircuitComponent]] = defaultdict(set)
 
-        if any(_is_switch(comp) and not _is_switch_closed(comp) for comp in candidate_group):
-            continue
+    wire_roots = _flatten(wire_parents)
+    for wire, idx in wire_indices.items():
+        root = wire_roots[idx]
+        for attachment in wire.attachments.values():
+            if not attachment:
+                continue
+            comp, side = attachment
+            comp_idx = component_index_get(comp)
+            if comp_idx is None:
+                continue
+            cluster_terminals[root].append(comp_idx * slot_count + TERMINAL_SIDE_SLOTS[side])
+            cluster_components[root].add(comp)
+
+    terminal_parents: List[int] = list(range(len(components) * slot_count))
+    terminal_rank: List[int] = [0] * len(terminal_parents)
+    for terminals in cluster_terminals.values():
+        terminal_iter = iter(terminals)
+        base = next(terminal_iter)
+        for terminal in terminal_iter:
+            _union(terminal_parents, terminal_rank, base, terminal)
+
+    terminal_roots = _flatten(terminal_parents)
+    node_members: DefaultDict[int, Set[int]] = defaultdict(set)
+    component_nodes: Dict[CircuitComponent, List[int]] = {component: [] for component in components}
+
+    for terminals in cluster_terminals.values():
+        for terminal_id in terminals:
+            comp_idx = terminal_id // slot_count
+            node_id = terminal_roots[terminal_id]
+            node_members[node_id].add(comp_idx)
+            nodes = component_nodes[components[comp_idx]]
+            if node_id not in nodes:
+                nodes.append(node_id)
+
+    component_parents: List[int] = list(range(len(components)))
+    component_rank: List[int] = [0] * len(components)
+
+    for member_set in node_members.values():
+        member_iter = iter(member_set)
+        base = next(member_iter)
+        for member in member_iter:
+            _union(component_parents, component_rank, base, member)
+
+    component_roots = _flatten(component_parents)
+    component_groups: DefaultDict[int, List[int]] = defaultdict(list)
+    for comp_idx, root in enumerate(component_roots):
+        component_groups[root].append(comp_idx)
+
+    cluster_group_roots: Dict[int, int] = {
+        cluster_id: component_roots[component_index[next(iter(comps))]]
+        for cluster_id, comps in cluster_components.items()
+        if len(comps) >= 2
+    }
+    wires_by_group: DefaultDict[int, List[CircuitWire]] = defaultdict(list)
+    for wire, idx in wire_indices.items():
+        group_root = cluster_group_roots.get(wire_roots[idx])
+        if group_root is not None:
+            wires_by_group[group_root].append(wire)
 
-        if not batteries or not loads:
-            continue
+    active_root: Optional[int] = None
+    active_group: Optional[List[CircuitComponent]] = None
+    group_batteries: List[CircuitComponent] = []
+    group_loads: List[CircuitComponent] = []
 
-        if not all(endpoint_counts.get(comp, 0) >= expected_connections(comp) for comp in candidate_group):
+    for group_root, member_indices in component_groups.items():
+        if len(member_indices) < 2:
             continue
 
-        active_group = candidate_group
-        group_batteries = batteries
-        group_loads = loads
-        break
+        # Stop scanning a group at its first open switch or under-connected member.
+        batteries: List[CircuitComponent] = []
+        loads: List[CircuitComponent] = []
+        for idx in member_indices:
+            role = roles[idx]
+            if role == "switch_open" or endpoint_counts[idx] < required_connections[idx]:
+                break
+            if role == "battery":
+                batteries.append(components[idx])
+            elif role == "load":
+                loads.append(components[idx])
+        else:
+            if batteries and loads:
+                active_root = group_root
+                active_group = [components[idx] for idx in member_indices]
+                group_batteries = batteries
+                group_loads = loads
+                break
 
     component_metrics: ComponentMetrics = {}
     active_wires: Optional[List[CircuitWire]] = None
+    path_builder: PathBuilder = None
 
     if active_group:
-        active_set = set(active_group)
-        active_cluster_ids: Set[int] = set()
-        for cluster_id, comps in cluster_components.items():
-            in_group = [comp for comp in comps if comp in active_set]
-            if len(in_group) >= 2:
-                active_cluster_ids.add(cluster_id)
-
-        if active_cluster_ids:
-            active_wires = [
-                wire
-                for wire in wires
-                if wire_cluster_lookup.get(wire) in active_cluster_ids
-            ]
-        else:
-            active_wires = []
-
+        active_set = frozenset(active_group)
+        active_wires = wires_by_group.get(active_root, [])
+        adjacency = _group_adjacency(active_group, components, component_nodes, node_members)
         circuit_type = classify_circuit(active_group, adjacency, group_loads, component_nodes)
-        summary, component_metrics, metric_issues = compute_circuit_metrics(active_group, group_batteries, group_loads, circuit_type)
+        summary, component_metrics, metric_issues = compute_circuit_metrics(
+            active_group,
+            group_batteries,
+            group_loads,
+            circuit_type,
+            resistances,
+            voltages,
+        )
 
         analysis.update({
             "type": circuit_type,
@@ -423,18 +555,19 @@ def analyze_circuit(
             "total_power": summary.get("total_power", 0.0),
             "active_component_count": len(active_group),
             "active_wire_count": len(active_wires) if active_wires else 0,
-            "path_description": describe_active_path(active_group, adjacency, group_batteries),
         })
-        analysis["issues"].extend(metric_issues)
+        issues.extend(metric_issues)
+        path_builder = partial(describe_active_path, active_set, adjacency, group_batteries)
 
         if analysis["status"] == "Closed" and summary.get("status_detail_override") == "✓ Circuit Complete & Powered":
             analysis["status_detail"] = f"✓ {circuit_type} circuit powered"
 
-    return analysis, active_group, active_wires, component_metrics
+    return (analysis, active_group, active_wires, component_metrics), path_builder
 
 
 __all__ = [
     "analyze_circuit",
+    "circuit_signature",
     "classify_circuit",
     "compute_circuit_metrics",
     "describe_active_path",
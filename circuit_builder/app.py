@@ -2,17 +2,73 @@ from __future__ import annotations
 
 import random
 import tkinter as tk
-from typing import Any, Dict, List, Optional, Set, Tuple
-from .analysis import analyze_circuit
-from .components import CircuitComponent
+from collections import defaultdict
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from .analysis import analyze_circuit, circuit_signature
+from .components import SWITCH_TYPES, CircuitComponent, flush_pending_wire_updates
 from .constants import (
     CANVAS_HEIGHT,
     CANVAS_WIDTH,
     COMPONENT_ICONS,
     COMPONENT_PREFIX,
     GRID_SIZE,
+    HALF_GRID,
 )
-from .wires import CircuitWire
+from .wires import ENDPOINT_IDS, CircuitWire
+
+AnchorIndex = Dict[Tuple[int, int], List[Tuple[int, float, float, CircuitComponent, str]]]
+
+ANCHOR_CELL_SIZE = 40
+SNAP_THRESHOLD = 36.0
+LOAD_TYPES = frozenset({"resistor"})
+CURSOR_CAPABLE_TYPES = (tk.Label, tk.Frame, tk.Button, tk.Entry)
+
+PALETTE_ITEMS: Tuple[Tuple[str, str], ...] = (
+    ("battery", "Battery"),
+    ("resistor", "Resistor"),
+    ("bulb", "Bulb"),
+    ("switch", "Switch"),
+    ("wire", "Wire"),
+)
+PALETTE_TILE_COLORS: Dict[bool, Tuple[str, str]] = {
+    False: ("#f8fafc", "#cbd5f5"),
+    True: ("#e0f2fe", "#3b82f6"),
+}
+
+FEATURE_LINES: Tuple[str, ...] = (
+    "Left-click a palette tile to add its component or wire to the canvas.",
+    "Drag components around the grid to reposition them precisely.",
+    "Right-click a component to rotate, edit values, duplicate, lock, or delete it.",
+    "Double-click a component to edit its voltage, resistance, or other properties instantly.",
+    "Drag wire endpoints onto component terminals or other wires to snap them together.",
+    "Double-click a wire to cut it from the circuit.",
+    "Hover a component tile to preview which item you are about to place.",
+    "Use the ♻ Reset Circuit button to clear every component and wire.",
+    "Select Circuit Functions to review this list of available interactions.",
+    "Press F11 to toggle fullscreen mode and Escape to exit it.",
+    "Watch the circuit insight panel for active path, metrics, and issues in real time.",
+)
+FORMATTED_FEATURE_TEXT = "\n".join(f"• {line}" for line in FEATURE_LINES)
+
+LABEL_PARTS: Dict[str, Tuple[str, str]] = {
+    comp_type: (comp_type.title(), prefix) for comp_type, prefix in COMPONENT_PREFIX.items()
+}
+
+
+def _snap_within(value: float, upper: float) -> int:
+    # Clamp a coordinate to [0, upper], snap it to the grid and clamp again in case snapping overshot.
+    value = int(max(0, min(value, upper)))
+    value = (value + HALF_GRID) // GRID_SIZE * GRID_SIZE
+    return int(max(0, min(value, upper)))
+
+
+def _label_parts(comp_type: str) -> Tuple[str, str]:
+    # Resolve a type's display name and code prefix once, remembering types outside COMPONENT_PREFIX too.
+    parts = LABEL_PARTS.get(comp_type)
+    if parts is None:
+        parts = LABEL_PARTS[comp_type] = (comp_type.capitalize(), comp_type[:1].upper())
+    return parts
 
 
 class OhmsLawApp:
@@ -36,16 +92,36 @@ class OhmsLawApp:
         self.wires: List[CircuitWire] = []
 
         self.status = tk.StringVar(value="Open Circuit")
-        self.circuit_type_var = tk.StringVar(value="Type: Open")
-        self.circuit_status_var = tk.StringVar(value="Status: Awaiting components")
-        self.circuit_metrics_var = tk.StringVar(value="Voltage: — | Current: —")
-        self.circuit_power_var = tk.StringVar(value="Power: — | Resistance: —")
-        self.circuit_counts_var = tk.StringVar(value="Components: 0 | Wires: 0")
-        self.circuit_path_var = tk.StringVar(value="Active path: —")
+        self.circuit_summary_var = tk.StringVar(value="\n".join((
+            "Type: Open",
+            "Status: Awaiting components",
+            "Voltage: — | Current: —",
+            "Power: — | Resistance: —",
+            "Components: 0 | Wires: 0",
+            "Active path: —",
+        )))
         self.status_label: Optional[tk.Label] = None
         self.functions_display: Optional[tk.Label] = None
         self.latest_analysis: Dict[str, Any] = {}
         self._auto_snap_guard = False
+        self._bulk_removal = False
+        self._dirty_endpoints: Set[Tuple[CircuitWire, str]] = set()
+        self._grid_tile: Optional[tk.PhotoImage] = None
+        self._grid_image: Optional[tk.PhotoImage] = None
+        self._resize_after_id: Optional[str] = None
+        self._recalc_after_id: Optional[str] = None
+        self._last_state_key: Optional[Tuple] = None
+        self._display_text: Dict[str, str] = {}
+        self._panel_inputs: Dict[str, Tuple] = {}
+        self._unique_issues: List[str] = []
+        self._highlighted: Set[CircuitComponent] = set()
+        self._palette_tile_children: Dict[tk.Frame, Tuple[tk.Label, tk.Label]] = {}
+        self._flash_targets: Dict[tk.Frame, Tuple[Tuple[tk.Widget, str], ...]] = {}
+        self._modal_cache: Dict[str, Tuple[tk.Toplevel, tk.Frame, Tuple[str, ...]]] = {}
+        self.canvas_width = CANVAS_WIDTH
+        self.canvas_height = CANVAS_HEIGHT
+        self._anchor_index: AnchorIndex = {}
+        self._anchor_index_stale = True
 
         self._create_widgets()
         self._draw_grid()
@@ -111,15 +187,7 @@ class OhmsLawApp:
         # Fill the palette with buttons representing placeable components.
         tk.Label(left_panel, text="Component Palette", font=("Arial", 12, "bold"), bg="#ffffff").pack(pady=(10, 5))
 
-        palette = [
-            ("battery", "Battery"),
-            ("resistor", "Resistor"),
-            ("bulb", "Bulb"),
-            ("switch", "Switch"),
-            ("wire", "Wire"),
-        ]
-
-        for comp_type, label in palette:
+        for comp_type, label in PALETTE_ITEMS:
             tile = tk.Frame(
                 left_panel,
                 bg="#f8fafc",
@@ -138,6 +206,7 @@ class OhmsLawApp:
                 text=COMPONENT_ICONS.get(comp_type, "❓"),
                 font=("Arial", 20),
                 bg="#f8fafc",
+                cursor="hand2",
             )
             icon_label.pack()
 
@@ -147,28 +216,18 @@ class OhmsLawApp:
                 font=("Arial", 9),
                 bg="#f8fafc",
                 fg="#334155",
+                cursor="hand2",
             )
             text_label.pack()
-            for widget in (icon_label, text_label):
-                widget.configure(cursor="hand2")
 
-            def make_handler(item_type: str):
-                # Return a click handler that adds the chosen item.
-                if item_type == "wire":
-                    return lambda _event=None: self._add_wire()
-                return lambda _event=None: self._add_component(item_type)
-
-            handler = make_handler(comp_type)
+            handler = partial(self._on_palette_click, comp_type)
             tile.bind("<Button-1>", handler)
             icon_label.bind("<Button-1>", handler)
             text_label.bind("<Button-1>", handler)
 
-            tile.bind("<Enter>", lambda _event, t=tile: self._set_palette_tile_state(t, True))
-            tile.bind("<Leave>", lambda _event, t=tile: self._set_palette_tile_state(t, False))
-            icon_label.bind("<Enter>", lambda _event, t=tile: self._set_palette_tile_state(t, True))
-            icon_label.bind("<Leave>", lambda _event, t=tile: self._set_palette_tile_state(t, False))
-            text_label.bind("<Enter>", lambda _event, t=tile: self._set_palette_tile_state(t, True))
-            text_label.bind("<Leave>", lambda _event, t=tile: self._set_palette_tile_state(t, False))
+            self._palette_tile_children[tile] = (icon_label, text_label)
+            tile.bind("<Enter>", self._on_palette_tile_enter)
+            tile.bind("<Leave>", self._on_palette_tile_leave)
 
     def _build_help_section(
         self, left_panel: tk.Frame
@@ -281,8 +340,6 @@ class OhmsLawApp:
             bd=2,
         )
         self.canvas.grid(row=1, column=0, sticky="nsew")
-        self.canvas_width = CANVAS_WIDTH
-        self.canvas_height = CANVAS_HEIGHT
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
     def _build_right_panel(self, main_frame: tk.Frame) -> Tuple[tk.Frame, tk.Label]:
@@ -382,50 +439,11 @@ class OhmsLawApp:
 
         tk.Label(
             analysis_frame,
-            textvariable=self.circuit_type_var,
-            font=("Arial", 9),
-            bg="#f8fafc",
-            fg="#1f2937",
-        ).pack(anchor="w", padx=12, pady=1)
-
-        tk.Label(
-            analysis_frame,
-            textvariable=self.circuit_status_var,
-            font=("Arial", 9),
-            bg="#f8fafc",
-            fg="#1f2937",
-        ).pack(anchor="w", padx=12, pady=1)
-
-        tk.Label(
-            analysis_frame,
-            textvariable=self.circuit_metrics_var,
-            font=("Arial", 9),
-            bg="#f8fafc",
-            fg="#1f2937",
-        ).pack(anchor="w", padx=12, pady=(4, 1))
-
-        tk.Label(
-            analysis_frame,
-            textvariable=self.circuit_power_var,
-            font=("Arial", 9),
-            bg="#f8fafc",
-            fg="#1f2937",
-        ).pack(anchor="w", padx=12, pady=1)
-
-        tk.Label(
-            analysis_frame,
-            textvariable=self.circuit_counts_var,
-            font=("Arial", 9),
-            bg="#f8fafc",
-            fg="#1f2937",
-        ).pack(anchor="w", padx=12, pady=(4, 1))
-
-        tk.Label(
-            analysis_frame,
-            textvariable=self.circuit_path_var,
+            textvariable=self.circuit_summary_var,
             font=("Arial", 9),
             bg="#f8fafc",
             fg="#1f2937",
+            justify=tk.LEFT,
         ).pack(anchor="w", padx=12, pady=1)
 
         tk.Label(
@@ -457,11 +475,9 @@ class OhmsLawApp:
         analysis_frame.bind("<Double-1>", self._show_insight_info)
         analysis_title.bind("<Double-1>", self._show_insight_info)
         for child in analysis_frame.winfo_children():
-            try:
+            if isinstance(child, CURSOR_CAPABLE_TYPES):
                 child.configure(cursor="hand2")
                 child.bind("<Double-1>", self._show_insight_info)
-            except tk.TclError:
-                continue
 
     def _initialize_analysis_state(self) -> None:
         # Seed the analysis panel with default values before any components exist.
@@ -483,58 +499,87 @@ class OhmsLawApp:
         self._update_analysis_panel(initial_analysis)
         self.latest_analysis = dict(initial_analysis)
 
+    def _on_palette_click(self, item_type: str, _event: Optional[tk.Event] = None) -> None:
+        # Add the palette item that was clicked, routing wires to their own builder.
+        if item_type == "wire":
+            self._add_wire()
+        else:
+            self._add_component(item_type)
+
     def _set_palette_tile_state(self, tile: tk.Frame, hover: bool) -> None:
         # Adjust palette tile styling in response to hover state changes.
-        base_bg = "#f8fafc"
-        hover_bg = "#e0f2fe"
-        base_border = "#cbd5f5"
-        hover_border = "#3b82f6"
-        bg = hover_bg if hover else base_bg
-        border = hover_border if hover else base_border
+        bg, border = PALETTE_TILE_COLORS[hover]
         tile.configure(bg=bg, highlightbackground=border)
-        for child in tile.winfo_children():
-            try:
-                child.configure(bg=bg)
-            except tk.TclError:
-                continue
+        for child in self._palette_tile_children.get(tile, ()):
+            child.configure(bg=bg)
+
+    def _on_palette_tile_enter(self, event: tk.Event) -> None:
+        # Highlight the tile whenever the pointer enters it or one of its labels.
+        self._set_palette_tile_state(event.widget, True)
+
+    def _on_palette_tile_leave(self, event: tk.Event) -> None:
+        # Clear the highlight unless the pointer only moved onto one of the tile's own labels.
+        tile = event.widget
+        target = tile.winfo_containing(event.x_root, event.y_root)
+        if target is tile or target in self._palette_tile_children.get(tile, ()):
+            return
+        self._set_palette_tile_state(tile, False)
 
     def _flash_panel(self, panel: tk.Frame, highlight_bg: str = "#dbeafe") -> None:
         # Temporarily flash a panel background to draw user attention.
-        originals: Dict[tk.Widget, str] = {}
-
-        def _collect(widget: tk.Widget) -> None:
-            # Capture and temporarily replace a widget's background color.
-            try:
-                originals[widget] = widget.cget("bg")
-                widget.configure(bg=highlight_bg)
-            except tk.TclError:
-                pass
-
-        _collect(panel)
-        for child in panel.winfo_children():
-            _collect(child)
-
-        def _restore() -> None:
-            # Restore each widget's original background color.
-            for widget, color in originals.items():
-                try:
-                    widget.configure(bg=color)
-                except tk.TclError:
-                    continue
-
-        panel.after(220, _restore)
+        targets = self._flash_targets.get(panel)
+        if targets is None:
+            # Panel colours are fixed once built, so capture the widgets and their backgrounds on first use.
+            targets = tuple((widget, widget.cget("bg")) for widget in (panel, *panel.winfo_children()))
+            self._flash_targets[panel] = targets
+
+        for widget, _ in targets:
+            widget.configure(bg=highlight_bg)
+        panel.after(220, self._restore_flash, targets)
+
+    def _restore_flash(self, targets: Tuple[Tuple[tk.Widget, str], ...]) -> None:
+        # Put back the backgrounds captured for a flashed panel.
+        for widget, color in targets:
+            widget.configure(bg=color)
+
+    def _open_modal(self, title: str, lines: Sequence[str], accent: str = "#2563eb") -> None:
+        # Present a modal dialog with a list of informational bullet points, reusing the window per title.
+        cached = self._modal_cache.get(title)
+        if cached is None:
+            modal, content = self._build_modal(title, accent)
+            shown_lines: Tuple[str, ...] = ()
+        else:
+            modal, content, shown_lines = cached
+
+        lines = tuple(lines)
+        if lines != shown_lines:
+            for child in content.winfo_children():
+                child.destroy()
+            for line in lines:
+                tk.Label(
+                    content,
+                    text=f"• {line}",
+                    font=("Segoe UI", 10),
+                    fg="#1f2937",
+                    bg="#f8fafc",
+                    justify=tk.LEFT,
+                    anchor="w",
+                    wraplength=460,
+                ).pack(anchor="w", pady=2)
+        self._modal_cache[title] = (modal, content, lines)
+
+        self._center_window(modal, 520, 420)
+        modal.deiconify()
+        modal.grab_set()
 
-    def _open_modal(self, title: str, lines: List[str], accent: str = "#2563eb") -> None:
-        # Present a modal dialog with a list of informational bullet points.
+    def _build_modal(self, title: str, accent: str) -> Tuple[tk.Toplevel, tk.Frame]:
+        # Create the modal window chrome once; closing it only hides the window for later reuse.
         modal = tk.Toplevel(self.root)
         modal.title(title)
         modal.configure(bg="#0f172a")
         modal.transient(self.root)
-        modal.grab_set()
         modal.resizable(False, False)
-
-        frame_width, frame_height = 520, 420
-        self._center_window(modal, frame_width, frame_height)
+        modal.protocol("WM_DELETE_WINDOW", partial(self._close_modal, modal))
 
         header = tk.Frame(modal, bg=accent)
         header.pack(fill=tk.X)
@@ -553,18 +598,6 @@ class OhmsLawApp:
         content = tk.Frame(body, bg="#f8fafc")
         content.pack(fill=tk.BOTH, expand=True)
 
-        for line in lines:
-            tk.Label(
-                content,
-                text=f"• {line}",
-                font=("Segoe UI", 10),
-                fg="#1f2937",
-                bg="#f8fafc",
-                justify=tk.LEFT,
-                anchor="w",
-                wraplength=460,
-            ).pack(anchor="w", pady=2)
-
         footer = tk.Frame(body, bg="#f8fafc")
         footer.pack(fill=tk.X, pady=(12, 0))
 
@@ -579,9 +612,16 @@ class OhmsLawApp:
             relief=tk.FLAT,
             padx=12,
             pady=4,
-            command=modal.destroy,
+            command=partial(self._close_modal, modal),
         ).pack(side=tk.RIGHT)
 
+        return modal, content
+
+    def _close_modal(self, modal: tk.Toplevel) -> None:
+        # Release the grab and hide the modal so the next open can reuse it.
+        modal.grab_release()
+        modal.withdraw()
+
     def _center_window(self, window: tk.Toplevel, width: int, height: int) -> None:
         # Position a child window centered relative to the main window.
         self.root.update_idletasks()
@@ -593,45 +633,29 @@ class OhmsLawApp:
         pos_y = root_y + max((root_height - height) // 2, 0)
         window.geometry(f"{width}x{height}+{pos_x}+{pos_y}")
 
-    def _feature_lines(self) -> List[str]:
+    def _feature_lines(self) -> Tuple[str, ...]:
         # Provide the list of quick tips describing available interactions.
-        return [
-            "Left-click a palette tile to add its component or wire to the canvas.",
-            "Drag components around the grid to reposition them precisely.",
-            "Right-click a component to rotate, edit values, duplicate, lock, or delete it.",
-            "Double-click a component to edit its voltage, resistance, or other properties instantly.",
-            "Drag wire endpoints onto component terminals or other wires to snap them together.",
-            "Double-click a wire to cut it from the circuit.",
-            "Hover a component tile to preview which item you are about to place.",
-            "Use the ♻ Reset Circuit button to clear every component and wire.",
-            "Select Circuit Functions to review this list of available interactions.",
-            "Press F11 to toggle fullscreen mode and Escape to exit it.",
-            "Watch the circuit insight panel for active path, metrics, and issues in real time.",
-        ]
+        return FEATURE_LINES
 
     def _formatted_feature_text(self) -> str:
         # Format feature lines as a bullet-separated string.
-        return "\n".join(f"• {line}" for line in self._feature_lines())
+        return FORMATTED_FEATURE_TEXT
 
     def _show_functions(self) -> None:
         # Display the full list of circuit functions in a modal window.
-        lines = self._feature_lines()
-        message = "\n".join(f"• {line}" for line in lines)
         if self.functions_display is not None:
-            self.functions_display.configure(text=message)
+            self.functions_display.configure(text=self._formatted_feature_text())
         if hasattr(self, "help_frame"):
             self._flash_panel(self.help_frame)
-        self._open_modal("Circuit Functions", lines, accent="#2563eb")
+        self._open_modal("Circuit Functions", self._feature_lines(), accent="#2563eb")
 
     def _show_tips_dialog(self, _event: Optional[tk.Event] = None) -> None:
         # Pop up the quick tips dialog when users request more guidance.
-        lines = self._feature_lines()
-        message = "\n".join(f"• {line}" for line in lines)
         if self.functions_display is not None:
-            self.functions_display.configure(text=message)
+            self.functions_display.configure(text=self._formatted_feature_text())
         if hasattr(self, "help_frame"):
             self._flash_panel(self.help_frame, highlight_bg="#0ea5e9")
-        self._open_modal("Circuit Quick Tips", lines, accent="#0ea5e9")
+        self._open_modal("Circuit Quick Tips", self._feature_lines(), accent="#0ea5e9")
 
     def _insight_lines(self) -> List[str]:
         # Return default descriptions for the insight modal when no data exists.
@@ -646,15 +670,10 @@ class OhmsLawApp:
 
     def _show_insight_info(self, _event: Optional[tk.Event] = None) -> None:
         # Summarize the current analysis results in a modal window.
+        if self._cancel_recalc():
+            self._flush_recalc()
         if self.latest_analysis:
-            lines: List[str] = [
-                self.circuit_type_var.get(),
-                self.circuit_status_var.get(),
-                self.circuit_metrics_var.get(),
-                self.circuit_power_var.get(),
-                self.circuit_counts_var.get(),
-                self.circuit_path_var.get(),
-            ]
+            lines: List[str] = self.circuit_summary_var.get().splitlines()
             issues_text = self.circuit_issue_label.cget("text") if self.circuit_issue_label else ""
             issue_lines = [entry.lstrip("• ").strip() for entry in issues_text.splitlines() if entry.strip()]
             if issue_lines:
@@ -684,12 +703,16 @@ class OhmsLawApp:
         return None
 
     def _draw_grid(self) -> None:
-        # Render a dotted grid background for precise component placement.
-        width = getattr(self, "canvas_width", CANVAS_WIDTH)
-        height = getattr(self, "canvas_height", CANVAS_HEIGHT)
-        for x in range(0, width, GRID_SIZE):
-            for y in range(0, height, GRID_SIZE):
-                self.canvas.create_oval(x, y, x + 1, y + 1, fill="#e5e7eb", outline="", tags="grid")
+        # Render a dotted grid background for precise component placement as a single tiled image item.
+        width = self.canvas_width
+        height = self.canvas_height
+        if self._grid_tile is None:
+            self._grid_tile = tk.PhotoImage(width=GRID_SIZE, height=GRID_SIZE)
+            self._grid_tile.put("#e5e7eb", to=(0, 0, 1, 1))
+        self._grid_image = tk.PhotoImage(width=width, height=height)
+        # Tk repeats the source across the whole target region when copying into a larger area.
+        self._grid_image.tk.call(self._grid_image, "copy", self._grid_tile, "-to", 0, 0, width, height)
+        self.canvas.create_image(0, 0, anchor="nw", image=self._grid_image, tags="grid")
         self.canvas.tag_lower("grid")
 
     # ------------------------------------------------------------------
@@ -697,35 +720,50 @@ class OhmsLawApp:
     # ------------------------------------------------------------------
     def _on_canvas_configure(self, event: tk.Event) -> None:
         # Redraw the grid when the canvas size changes.
-        if event.width <= 0 or event.height <= 0:
+        width = event.width
+        height = event.height
+        if width <= 0 or height <= 0:
             return
-        if event.width == getattr(self, "canvas_width", 0) and event.height == getattr(self, "canvas_height", 0):
+        if width == self.canvas_width and height == self.canvas_height:
             return
-        self.canvas_width = event.width
-        self.canvas_height = event.height
+        self.canvas_width = width
+        self.canvas_height = height
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._perform_grid_redraw)
+
+    def _perform_grid_redraw(self) -> None:
+        # Rebuild the grid once the burst of resize events has settled.
+        self._resize_after_id = None
         self.canvas.delete("grid")
         self._draw_grid()
 
     def _register_component(self, component: CircuitComponent) -> None:
         # Track a new component and provide duplication support.
         component.on_request_duplicate = self._duplicate_component
+        component.on_anchors_changed = self._invalidate_anchor_index
         self.components.append(component)
+        self._anchor_index_stale = True
+        self._mark_all_endpoints_dirty()
+
+    def _next_labels(self, comp_type: str) -> Tuple[str, str]:
+        # Advance the per-type counter and return the display and code labels for the next instance.
+        index = self.component_type_counters.get(comp_type, 0) + 1
+        self.component_type_counters[comp_type] = index
+        type_name, prefix = _label_parts(comp_type)
+        return f"{type_name} {index}", f"{prefix}{index}"
 
     def _add_component(self, comp_type: str) -> None:
         # Place a new component instance onto the canvas.
-        canvas_width = int(getattr(self, "canvas_width", CANVAS_WIDTH))
-        canvas_height = int(getattr(self, "canvas_height", CANVAS_HEIGHT))
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
         x = canvas_width // 2 + random.randint(-100, 100)
         y = canvas_height // 2 + random.randint(-100, 100)
 
-        x = round(x / GRID_SIZE) * GRID_SIZE
-        y = round(y / GRID_SIZE) * GRID_SIZE
+        x = (x + HALF_GRID) // GRID_SIZE * GRID_SIZE
+        y = (y + HALF_GRID) // GRID_SIZE * GRID_SIZE
 
-        self.component_type_counters[comp_type] = self.component_type_counters.get(comp_type, 0) + 1
-        index = self.component_type_counters[comp_type]
-        display_label = f"{comp_type.capitalize()} {index}" if comp_type not in COMPONENT_PREFIX else f"{comp_type.title()} {index}"
-        prefix = COMPONENT_PREFIX.get(comp_type, comp_type[:1].upper())
-        code_label = f"{prefix}{index}"
+        display_label, code_label = self._next_labels(comp_type)
 
         component = CircuitComponent(
             self.canvas,
@@ -740,29 +778,21 @@ class OhmsLawApp:
         )
         self._register_component(component)
         self.component_counter += 1
-        self._calculate_circuit()
+        self._schedule_recalc()
 
     def _duplicate_component(self, component: CircuitComponent) -> None:
         # Clone an existing component's configuration nearby on the canvas.
-        canvas_width = int(getattr(self, "canvas_width", CANVAS_WIDTH))
-        canvas_height = int(getattr(self, "canvas_height", CANVAS_HEIGHT))
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
         comp_type = component.type
 
-        self.component_type_counters[comp_type] = self.component_type_counters.get(comp_type, 0) + 1
-        index = self.component_type_counters[comp_type]
-        display_label = f"{comp_type.capitalize()} {index}" if comp_type not in COMPONENT_PREFIX else f"{comp_type.title()} {index}"
-        prefix = COMPONENT_PREFIX.get(comp_type, comp_type[:1].upper())
-        code_label = f"{prefix}{index}"
+        display_label, code_label = self._next_labels(comp_type)
 
         width, height = component._current_dimensions()
         offset_x = component.x + GRID_SIZE * 4
         offset_y = component.y + GRID_SIZE * 2
-        new_x = int(max(0, min(offset_x, canvas_width - width)))
-        new_y = int(max(0, min(offset_y, canvas_height - height)))
-        new_x = round(new_x / GRID_SIZE) * GRID_SIZE
-        new_y = round(new_y / GRID_SIZE) * GRID_SIZE
-        new_x = int(max(0, min(new_x, canvas_width - width)))
-        new_y = int(max(0, min(new_y, canvas_height - height)))
+        new_x = _snap_within(offset_x, canvas_width - width)
+        new_y = _snap_within(offset_y, canvas_height - height)
 
         duplicate = CircuitComponent(
             self.canvas,
@@ -786,21 +816,18 @@ class OhmsLawApp:
 
         if component.orientation != duplicate.orientation:
             duplicate.rotate()
-        else:
-            duplicate._draw_visual_representation()
 
-        if duplicate.locked:
-            duplicate._build_context_menu()
         duplicate.apply_theme(duplicate.theme)
-        duplicate._update_detail_text()
+        # Refresh the detail text and schematic for the copied values.
+        duplicate._request_redraw()
 
         self._register_component(duplicate)
-        self._calculate_circuit()
+        self._schedule_recalc()
 
     def _add_wire(self) -> None:
         # Introduce a standalone wire segment ready for connections.
-        canvas_width = int(getattr(self, "canvas_width", CANVAS_WIDTH))
-        canvas_height = int(getattr(self, "canvas_height", CANVAS_HEIGHT))
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
         x = canvas_width // 2
         y = canvas_height // 2
         wire = CircuitWire(
@@ -812,16 +839,17 @@ class OhmsLawApp:
             self._find_nearest_connector,
         )
         self.wires.append(wire)
+        self._mark_endpoints_dirty(wire)
         attached_count = self._attach_wire_endpoints_to_nearest_wires(wire)
         if attached_count < 2:
             self._auto_snap_connections()
-        self._calculate_circuit()
+        self._schedule_recalc()
 
     def _attach_wire_endpoints_to_nearest_wires(self, wire: CircuitWire) -> int:
         # Attempt to snap the provided wire's endpoints onto the closest existing wires.
         attached = 0
         used_targets: Set[CircuitWire] = set()
-        for endpoint in ("a", "b"):
+        for endpoint in ENDPOINT_IDS:
             if wire.attachments.get(endpoint):
                 attached += 1
                 continue
@@ -846,36 +874,80 @@ class OhmsLawApp:
 
     def _on_component_changed(self, _component: CircuitComponent) -> None:
         # Recalculate the circuit when a component changes.
-        self._calculate_circuit()
+        # A moved component may now sit on any loose wire end, so every endpoint gets another snap attempt.
+        self._anchor_index_stale = True
+        self._mark_all_endpoints_dirty()
+        self._schedule_recalc()
 
     def _on_component_removed(self, component: CircuitComponent) -> None:
         # Remove a component and detach any linked wires.
+        if self._bulk_removal:
+            return
         if component in self.components:
             self.components.remove(component)
-        for wire in self.wires[:]:
+        self._anchor_index_stale = True
+        for wire in self.wires:
             wire.detach_component(component)
-        self._calculate_circuit()
+        self._schedule_recalc()
 
-    def _on_wire_changed(self, _wire: CircuitWire) -> None:
+    def _on_wire_changed(self, wire: CircuitWire) -> None:
         # Re-run calculations when a wire is adjusted.
-        if self._auto_snap_guard:
+        if self._auto_snap_guard or self._bulk_removal:
             return
-        self._calculate_circuit()
+        self._mark_endpoints_dirty(wire)
+        self._mark_loose_ends_near(wire)
+        self._schedule_recalc()
 
     def _on_wire_removed(self, wire: CircuitWire) -> None:
         # Clean up when a wire is deleted from the canvas.
+        if self._bulk_removal:
+            return
         if wire in self.wires:
             self.wires.remove(wire)
-        self._calculate_circuit()
+        # The removed wire's link partners were unlinked without an on_change, so any of their ends may be loose now.
+        self._mark_all_endpoints_dirty()
+        self._schedule_recalc()
+
+    def _mark_endpoints_dirty(self, wire: CircuitWire) -> None:
+        # Queue both ends of a wire for the next auto-snap pass.
+        for endpoint in ENDPOINT_IDS:
+            self._dirty_endpoints.add((wire, endpoint))
+
+    def _mark_loose_ends_near(self, wire: CircuitWire) -> None:
+        # Queue other wires' unconnected ends that the changed wire now passes within snap range of.
+        min_x, min_y, max_x, max_y = wire.path_bounds()
+        min_x -= SNAP_THRESHOLD
+        min_y -= SNAP_THRESHOLD
+        max_x += SNAP_THRESHOLD
+        max_y += SNAP_THRESHOLD
+        for other in self.wires:
+            if other is wire:
+                continue
+            for endpoint in ENDPOINT_IDS:
+                if other.attachments.get(endpoint) or other.links.get(endpoint):
+                    continue
+                position = other.positions.get(endpoint)
+                if position and min_x <= position[0] <= max_x and min_y <= position[1] <= max_y:
+                    self._dirty_endpoints.add((other, endpoint))
+
+    def _mark_all_endpoints_dirty(self) -> None:
+        # Queue every wire end for the next auto-snap pass.
+        for wire in self.wires:
+            self._mark_endpoints_dirty(wire)
 
     def _auto_snap_connections(self) -> None:
         # Connect wires to nearby terminals automatically when possible.
-        if self._auto_snap_guard:
+        # Only endpoints queued since the last pass are searched; the rest already failed to find a target.
+        if self._auto_snap_guard or not self._dirty_endpoints:
             return
+        dirty = self._dirty_endpoints
+        self._dirty_endpoints = set()
         self._auto_snap_guard = True
         try:
             for wire in self.wires:
-                for endpoint in ("a", "b"):
+                for endpoint in ENDPOINT_IDS:
+                    if (wire, endpoint) not in dirty:
+                        continue
                     if wire.attachments.get(endpoint):
                         continue
                     if wire.links.get(endpoint):
@@ -892,21 +964,42 @@ class OhmsLawApp:
         finally:
             self._auto_snap_guard = False
 
+    def _invalidate_anchor_index(self, _component: CircuitComponent) -> None:
+        # A component moved, rotated or resized; rebuild the terminal grid on the next lookup.
+        self._anchor_index_stale = True
+
+    def _component_anchor_index(self) -> AnchorIndex:
+        # Bucket every component terminal into a coarse grid, rebuilding only after a component is added,
+        # removed, or reports new terminal positions.
+        if self._anchor_index_stale:
+            anchor_index: AnchorIndex = defaultdict(list)
+            order = 0
+            for component in self.components:
+                for side, (cx, cy) in component.anchor_points().items():
+                    cell = (int(cx // ANCHOR_CELL_SIZE), int(cy // ANCHOR_CELL_SIZE))
+                    anchor_index[cell].append((order, cx, cy, component, side))
+                    order += 1
+            self._anchor_index = dict(anchor_index)
+            self._anchor_index_stale = False
+        return self._anchor_index
+
     def _find_nearest_connector(
         self,
         x: float,
         y: float,
         exclude_wire: Optional[CircuitWire] = None,
         exclude_endpoint: Optional[str] = None,
-        threshold: float = 36.0,
+        threshold: float = SNAP_THRESHOLD,
         target_types: Optional[Tuple[str, ...]] = None,
         exclude_wires: Optional[Set[CircuitWire]] = None,
     ) -> tuple[Any | None, Any, tuple[float, float]]:
         # Find the closest connector matching the requested filter at the given canvas point.
+        # exclude_wire is skipped outright, so exclude_endpoint only completes the ConnectorFinder signature.
         target: Any | None = None
         identifier: Any = None
         snap_point: tuple[float, float] = (x, y)
-        best_distance = threshold
+        # Distances are compared squared; the ordering matches true distances without a sqrt per candidate.
+        best_distance_sq = threshold * threshold
         allowed_components = target_types is None or "component" in target_types
         allowed_wires = target_types is None or "wire" in target_types
         skip_wires: Set[CircuitWire] = set()
@@ -915,61 +1008,62 @@ class OhmsLawApp:
         if exclude_wires:
             skip_wires.update(exclude_wires)
 
-        def project_point(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> tuple[float, float]:
-            # Project point p onto segment ab to find the closest spot.
-            dx = bx - ax
-            dy = by - ay
-            if dx == 0 and dy == 0:
-                return ax, ay
-            t = ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)
-            t = max(0.0, min(1.0, t))
-            return ax + t * dx, ay + t * dy
-
         if allowed_components:
-            for component in self.components:
-                for side in ("left", "right", "top", "bottom"):
-                    cx, cy = component.anchor_point(side)
-                    dist = ((cx - x) ** 2 + (cy - y) ** 2) ** 0.5
-                    if dist <= best_distance:
-                        best_distance = dist
-                        target = component
-                        identifier = side
-                        snap_point = (cx, cy)
+            anchor_index = self._component_anchor_index()
+            # Equal distances resolve to the later anchor in component order, as a full scan would.
+            best_order = -1
+            first_col = int((x - threshold) // ANCHOR_CELL_SIZE)
+            last_col = int((x + threshold) // ANCHOR_CELL_SIZE)
+            first_row = int((y - threshold) // ANCHOR_CELL_SIZE)
+            last_row = int((y + threshold) // ANCHOR_CELL_SIZE)
+            for col in range(first_col, last_col + 1):
+                for row in range(first_row, last_row + 1):
+                    for order, cx, cy, component, side in anchor_index.get((col, row), ()):
+                        dist_sq = (cx - x) ** 2 + (cy - y) ** 2
+                        if dist_sq < best_distance_sq or (dist_sq == best_distance_sq and order > best_order):
+                            best_distance_sq = dist_sq
+                            best_order = order
+                            target = component
+                            identifier = side
+                            snap_point = (cx, cy)
 
         if allowed_wires:
             for wire in self.wires:
                 if wire in skip_wires:
                     continue
-                for ep in ("a", "b"):
-                    if wire is exclude_wire and exclude_endpoint and ep == exclude_endpoint:
-                        continue
+                # Nothing on the wire can beat the current best if its bounding box is already farther away.
+                min_x, min_y, max_x, max_y = wire.path_bounds()
+                gap_x = max(min_x - x, x - max_x, 0.0)
+                gap_y = max(min_y - y, y - max_y, 0.0)
+                if gap_x * gap_x + gap_y * gap_y > best_distance_sq:
+                    continue
+                for ep in ENDPOINT_IDS:
                     wx, wy = wire.positions.get(ep, (0.0, 0.0))
-                    dist = ((wx - x) ** 2 + (wy - y) ** 2) ** 0.5
-                    if dist <= best_distance:
-                        best_distance = dist
+                    dist_sq = (wx - x) ** 2 + (wy - y) ** 2
+                    if dist_sq <= best_distance_sq:
+                        best_distance_sq = dist_sq
                         target = wire
                         identifier = ep
                         snap_point = (wx, wy)
 
-                path_points: List[Tuple[float, float]]
-                if hasattr(wire, "path_points"):
-                    path_points = list(wire.path_points())
-                else:
-                    path_points = [
-                        wire.positions.get("a", (0.0, 0.0)),
-                        wire.positions.get("b", (0.0, 0.0)),
-                    ]
-                for idx in range(len(path_points) - 1):
-                    ax, ay = path_points[idx]
-                    bx, by = path_points[idx + 1]
-                    px, py = project_point(x, y, ax, ay, bx, by)
-                    dist = ((px - x) ** 2 + (py - y) ** 2) ** 0.5
-                    if dist <= best_distance:
-                        end_a_dist = ((px - ax) ** 2 + (py - ay) ** 2) ** 0.5
-                        end_b_dist = ((px - bx) ** 2 + (py - by) ** 2) ** 0.5
-                        if min(end_a_dist, end_b_dist) < 6.0:
+                for idx, (ax, ay, bx, by, dx, dy, length_sq) in enumerate(wire.path_segments()):
+                    # Project the query point onto segment ab, clamped to the segment.
+                    if length_sq == 0:
+                        px, py = ax, ay
+                    else:
+                        t = ((x - ax) * dx + (y - ay) * dy) / length_sq
+                        if t < 0.0:
+                            t = 0.0
+                        elif t > 1.0:
+                            t = 1.0
+                        px, py = ax + t * dx, ay + t * dy
+                    dist_sq = (px - x) ** 2 + (py - y) ** 2
+                    if dist_sq <= best_distance_sq:
+                        end_a_dist_sq = (px - ax) ** 2 + (py - ay) ** 2
+                        end_b_dist_sq = (px - bx) ** 2 + (py - by) ** 2
+                        if min(end_a_dist_sq, end_b_dist_sq) < 36.0:
                             continue
-                        best_distance = dist
+                        best_distance_sq = dist_sq
                         target = wire
                         identifier = ("segment", px, py, idx)
                         snap_point = (px, py)
@@ -981,74 +1075,136 @@ class OhmsLawApp:
     # ------------------------------------------------------------------
     def _update_component_highlights(self, active_group: Optional[List[CircuitComponent]]) -> None:
         # Highlight components that belong to the currently active circuit path.
-        active_ids = {comp.id for comp in active_group} if active_group else set()
-        for comp in self.components:
-            comp.set_active(comp.id in active_ids)
+        # Only components whose state flips are touched; each set_active call restyles the widget through Tk.
+        highlighted = set(active_group) if active_group else set()
+        for comp in self._highlighted - highlighted:
+            comp.set_active(False)
+        for comp in highlighted - self._highlighted:
+            comp.set_active(True)
+        self._highlighted = highlighted
 
     def _update_analysis_panel(self, analysis: Dict[str, Any]) -> None:
         # Populate the analysis widgets with the latest computed metrics.
-        circuit_type = analysis.get("type", "Open")
-        status_detail = analysis.get("status_detail", "Open Circuit")
-        status_state = analysis.get("status", "Open")
-        total_voltage = float(analysis.get("total_voltage", 0.0))
-        total_current = float(analysis.get("total_current", 0.0))
-        total_power = float(analysis.get("total_power", 0.0))
-        total_resistance = float(analysis.get("total_resistance", 0.0))
-
-        self.circuit_type_var.set(f"Type: {circuit_type}")
-        self.circuit_status_var.set(f"Status: {status_state} – {status_detail}")
-
-        show_metrics = (total_voltage > 0 or total_current > 0 or status_state == "Alert")
-        if show_metrics:
-            self.circuit_metrics_var.set(f"Voltage: {total_voltage:.2f} V | Current: {total_current:.3f} A")
-        else:
-            self.circuit_metrics_var.set("Voltage: — | Current: —")
+        # Each block is formatted only when its inputs differ from the last update.
+        summary_inputs = (
+            analysis.get("type", "Open"),
+            analysis.get("status_detail", "Open Circuit"),
+            analysis.get("status", "Open"),
+            float(analysis.get("total_voltage", 0.0)),
+            float(analysis.get("total_current", 0.0)),
+            float(analysis.get("total_power", 0.0)),
+            float(analysis.get("total_resistance", 0.0)),
+            int(analysis.get("component_count", 0)),
+            int(analysis.get("wire_count", 0)),
+            int(analysis.get("active_component_count", 0)),
+            int(analysis.get("active_wire_count", 0)),
+            analysis.get("path_description", "—"),
+        )
+        if summary_inputs != self._panel_inputs.get("summary"):
+            self._panel_inputs["summary"] = summary_inputs
+            (
+                circuit_type,
+                status_detail,
+                status_state,
+                total_voltage,
+                total_current,
+                total_power,
+                total_resistance,
+                total_components,
+                total_wires,
+                active_components,
+                active_wires,
+                path_description,
+            ) = summary_inputs
+
+            summary_lines = [
+                f"Type: {circuit_type}",
+                f"Status: {status_state} – {status_detail}",
+            ]
 
-        show_power = (total_power > 0 or total_resistance > 0 or status_state == "Alert")
-        if show_power:
-            if total_resistance > 0:
-                resistance_text = f"{total_resistance:.2f} Ω"
-            elif total_resistance == 0:
-                resistance_text = "0.00 Ω"
+            show_metrics = (total_voltage > 0 or total_current > 0 or status_state == "Alert")
+            if show_metrics:
+                summary_lines.append(f"Voltage: {total_voltage:.2f} V | Current: {total_current:.3f} A")
             else:
-                resistance_text = "∞"
-            self.circuit_power_var.set(f"Power: {total_power:.3f} W | Resistance: {resistance_text}")
-        else:
-            self.circuit_power_var.set("Power: — | Resistance: —")
-
-        total_components = int(analysis.get("component_count", 0))
-        total_wires = int(analysis.get("wire_count", 0))
-        active_components = int(analysis.get("active_component_count", 0))
-        active_wires = int(analysis.get("active_wire_count", 0))
-        if active_components or active_wires:
-            counts_text = (
-                f"Components: {total_components} (active {active_components}) | "
-                f"Wires: {total_wires} (active {active_wires})"
-            )
-        else:
-            counts_text = f"Components: {total_components} | Wires: {total_wires}"
-        self.circuit_counts_var.set(counts_text)
+                summary_lines.append("Voltage: — | Current: —")
+
+            show_power = (total_power > 0 or total_resistance > 0 or status_state == "Alert")
+            if show_power:
+                if total_resistance > 0:
+                    resistance_text = f"{total_resistance:.2f} Ω"
+                elif total_resistance == 0:
+                    resistance_text = "0.00 Ω"
+                else:
+                    resistance_text = "∞"
+                summary_lines.append(f"Power: {total_power:.3f} W | Resistance: {resistance_text}")
+            else:
+                summary_lines.append("Power: — | Resistance: —")
 
-        path_description = analysis.get("path_description", "—")
-        if isinstance(path_description, str) and path_description != "—":
-            self.circuit_path_var.set(f"Active path: {path_description}")
-        else:
-            self.circuit_path_var.set("Active path: —")
-
-        issues = list(analysis.get("issues", []))
-        if issues:
-            unique_issues = list(dict.fromkeys(issues))
-            display_lines = [f"• {issue}" for issue in unique_issues[:4]]
-            if len(unique_issues) > 4:
-                display_lines.append(f"• +{len(unique_issues) - 4} more")
-            issues_text = "\n".join(display_lines)
-        else:
-            issues_text = "• No issues detected"
-        self.circuit_issue_label.config(text=issues_text)
+            if active_components or active_wires:
+                counts_text = (
+                    f"Components: {total_components} (active {active_components}) | "
+                    f"Wires: {total_wires} (active {active_wires})"
+                )
+            else:
+                counts_text = f"Components: {total_components} | Wires: {total_wires}"
+            summary_lines.append(counts_text)
+
+            if isinstance(path_description, str) and path_description != "—":
+                summary_lines.append(f"Active path: {path_description}")
+            else:
+                summary_lines.append("Active path: —")
+            self.circuit_summary_var.set("\n".join(summary_lines))
+
+        # One pass de-duplicates the issues and formats the first four; the unique list replaces the input.
+        issues = tuple(analysis.get("issues", ()))
+        if issues != self._panel_inputs.get("issues"):
+            self._panel_inputs["issues"] = issues
+            seen: Set[str] = set()
+            unique_issues: List[str] = []
+            display_lines: List[str] = []
+            for issue in issues:
+                if issue in seen:
+                    continue
+                seen.add(issue)
+                unique_issues.append(issue)
+                if len(display_lines) < 4:
+                    display_lines.append(f"• {issue}")
+            hidden = len(unique_issues) - len(display_lines)
+            if hidden:
+                display_lines.append(f"• +{hidden} more")
+            self._unique_issues = unique_issues
+            self.circuit_issue_label.config(text="\n".join(display_lines) if display_lines else "• No issues detected")
+        analysis["issues"] = self._unique_issues
+
+    def _schedule_recalc(self) -> None:
+        # Coalesce a burst of edits into a single recalculation once Tk is idle.
+        if self._recalc_after_id is None:
+            self._recalc_after_id = self.root.after_idle(self._flush_recalc)
+
+    def _flush_recalc(self) -> None:
+        # Run the recalculation queued by _schedule_recalc.
+        self._recalc_after_id = None
+        # A component moved since this was queued may still owe its wires their new anchors.
+        flush_pending_wire_updates()
+        self._calculate_circuit()
+
+    def _cancel_recalc(self) -> bool:
+        # Drop a queued recalculation, reporting whether one was pending.
+        if self._recalc_after_id is None:
+            return False
+        self.root.after_cancel(self._recalc_after_id)
+        self._recalc_after_id = None
+        return True
 
     def _calculate_circuit(self) -> None:
         # Perform a fresh analysis and update UI elements accordingly.
         self._auto_snap_connections()
+        # The same key the analysis layer uses, so the two change checks cannot drift apart.
+        state_key = circuit_signature(self.components, self.wires)
+        if state_key == self._last_state_key:
+            # Pure geometry moves leave every displayed value unchanged.
+            return
+        self._last_state_key = state_key
         analysis, active_group, active_wires, component_metrics = analyze_circuit(self.components, self.wires)
 
         self._update_component_highlights(active_group)
@@ -1068,16 +1224,8 @@ class OhmsLawApp:
                     float(metrics.get("power", 0.0)),
                 )
 
-            self.v_entry.config(state="normal")
-            self.i_entry.config(state="normal")
-            self.r_entry.config(state="normal")
-            self.p_entry.config(state="normal")
-
-            self.v_entry.delete(0, tk.END)
-            self.v_entry.insert(0, f"{float(analysis.get('total_voltage', 0.0)):.3f} V")
-
-            self.i_entry.delete(0, tk.END)
-            self.i_entry.insert(0, f"{float(analysis.get('total_current', 0.0)):.4f} A")
+            self._set_entry_text("voltage", self.v_entry, f"{float(analysis.get('total_voltage', 0.0)):.3f} V")
+            self._set_entry_text("current", self.i_entry, f"{float(analysis.get('total_current', 0.0)):.4f} A")
 
             total_resistance = float(analysis.get("total_resistance", 0.0))
             if total_resistance > 0:
@@ -1086,30 +1234,28 @@ class OhmsLawApp:
                 resistance_display = "0.00 Ω"
             else:
                 resistance_display = "∞"
-            self.r_entry.delete(0, tk.END)
-            self.r_entry.insert(0, resistance_display)
-
-            self.p_entry.delete(0, tk.END)
-            self.p_entry.insert(0, f"{float(analysis.get('total_power', 0.0)):.3f} W")
-
-            self.v_entry.config(state="readonly")
-            self.i_entry.config(state="readonly")
-            self.r_entry.config(state="readonly")
-            self.p_entry.config(state="readonly")
+            self._set_entry_text("resistance", self.r_entry, resistance_display)
+            self._set_entry_text("power", self.p_entry, f"{float(analysis.get('total_power', 0.0)):.3f} W")
 
             status_color = "#facc15" if analysis.get("status") == "Alert" else "#10b981"
-            self.status.set(str(analysis.get("status_detail", "✓ Circuit Complete & Powered")))
-            if self.status_label is not None:
-                self.status_label.config(fg=status_color)
+            self._set_status(str(analysis.get("status_detail", "✓ Circuit Complete & Powered")), status_color)
         else:
             if not self.components:
                 self._reset_values()
             else:
-                has_battery = any(comp.type == "battery" and comp.get_voltage() > 0 for comp in self.components)
-                load_types = {"resistor"}
-                has_load = any(comp.type in load_types and comp.get_resistance() > 0 for comp in self.components)
-                switch_components = [comp for comp in self.components if hasattr(comp, "is_switch") and comp.is_switch()]
-                open_switches = [comp for comp in switch_components if not comp.is_switch_closed()]
+                has_battery = False
+                has_load = False
+                open_switches: List[CircuitComponent] = []
+                for comp in self.components:
+                    comp_type = comp.type
+                    if comp_type == "battery":
+                        if comp.get_voltage() > 0:
+                            has_battery = True
+                    elif comp_type in LOAD_TYPES:
+                        if comp.get_resistance() > 0:
+                            has_load = True
+                    elif comp_type in SWITCH_TYPES and not comp.switch_closed:
+                        open_switches.append(comp)
 
                 if open_switches and has_battery and has_load:
                     switch_names = ", ".join(comp.display_label for comp in open_switches[:2])
@@ -1141,57 +1287,66 @@ class OhmsLawApp:
                 analysis["status_detail"] = message
                 self._reset_values(message, color)
 
-        analysis["issues"] = list(dict.fromkeys(analysis.get("issues", [])))
-        self.latest_analysis = dict(analysis)
-        self.latest_analysis["issues"] = list(analysis.get("issues", []))
+        # The panel leaves the de-duplicated issues on the analysis, so snapshot it afterwards.
         self._update_analysis_panel(analysis)
+        self.latest_analysis = dict(analysis)
     
     
 
     def _reset_values(self, status_text: str = "⚫ Open Circuit", status_color: str = "#9ca3af") -> None:
         # Clear metric displays and update the status label to the provided state.
-        self.v_entry.config(state="normal")
-        self.i_entry.config(state="normal")
-        self.r_entry.config(state="normal")
-        self.p_entry.config(state="normal")
-
-        self.v_entry.delete(0, tk.END)
-        self.v_entry.insert(0, "—")
-
-        self.i_entry.delete(0, tk.END)
-        self.i_entry.insert(0, "—")
-
-        self.r_entry.delete(0, tk.END)
-        self.r_entry.insert(0, "—")
-
-        self.p_entry.delete(0, tk.END)
-        self.p_entry.insert(0, "—")
-
-        self.v_entry.config(state="readonly")
-        self.i_entry.config(state="readonly")
-        self.r_entry.config(state="readonly")
-        self.p_entry.config(state="readonly")
-
-        self.status.set(status_text)
-        if self.status_label is not None:
-            self.status_label.config(fg=status_color)
+        self._set_entry_text("voltage", self.v_entry, "—")
+        self._set_entry_text("current", self.i_entry, "—")
+        self._set_entry_text("resistance", self.r_entry, "—")
+        self._set_entry_text("power", self.p_entry, "—")
+        self._set_status(status_text, status_color)
+
+    def _set_entry_text(self, key: str, entry: tk.Entry, text: str) -> None:
+        # Rewrite a read-only metric entry only when its displayed text changes.
+        if self._display_text.get(key) == text:
+            return
+        self._display_text[key] = text
+        entry.config(state="normal")
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+        entry.config(state="readonly")
+
+    def _set_status(self, text: str, color: str) -> None:
+        # Update the header status text and colour, skipping the Tk calls when neither changed.
+        if self._display_text.get("status") != text:
+            self._display_text["status"] = text
+            self.status.set(text)
+        if self.status_label is not None and self._display_text.get("status_color") != color:
+            self._display_text["status_color"] = color
+            self.status_label.config(fg=color)
 
     def _reset_circuit(self) -> None:
         # Remove all components and wires, then redraw a clean canvas.
-        for comp in self.components[:]:
-            comp.remove()
-        self.components.clear()
-        self.component_counter = 0
-        self.component_type_counters.clear()
-        self._reset_values()
-        self.canvas.delete("all")
-        self._update_component_highlights(None)
-        for wire in self.wires[:]:
-            wire.remove()
-        self.wires.clear()
+        # Removal callbacks stand down while the lists are torn down, so each list is cleared once.
+        self._bulk_removal = True
+        try:
+            for comp in self.components:
+                comp.remove()
+            self.components.clear()
+            self.component_counter = 0
+            self.component_type_counters.clear()
+            self._reset_values()
+            self.canvas.delete("all")
+            self._update_component_highlights(None)
+            for wire in self.wires:
+                wire.remove()
+            self.wires.clear()
+        finally:
+            self._bulk_removal = False
+        self._cancel_recalc()
+        self._dirty_endpoints.clear()
+        self._last_state_key = None
+        self._anchor_index = {}
+        self._anchor_index_stale = True
         self._draw_grid()
 
-        self._update_analysis_panel({
+        # The pending recalculation was dropped above, so record the empty circuit's analysis here.
+        reset_analysis: Dict[str, Any] = {
             "component_count": 0,
             "wire_count": 0,
             "active_component_count": 0,
@@ -1205,7 +1360,9 @@ class OhmsLawApp:
             "total_power": 0.0,
             "path_description": "—",
             "issues": [],
-        })
+        }
+        self._update_analysis_panel(reset_analysis)
+        self.latest_analysis = dict(reset_analysis)
 
 
 __all__ = ["OhmsLawApp"]
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import math
-import time
 import tkinter as tk
+from functools import lru_cache
 from tkinter import simpledialog
-from typing import Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
 from .constants import (
     CANVAS_HEIGHT,
@@ -12,6 +12,7 @@ from .constants import (
     COMPONENT_ICONS,
     COMPONENT_PROPS,
     GRID_SIZE,
+    HALF_GRID,
 )
 from .themes import DEFAULT_THEME, Theme
 
@@ -20,7 +21,86 @@ if TYPE_CHECKING:
 
 
 DRAG_THROTTLE_MS = 8
-SWITCH_TYPES = {"switch", "switch_spst", "switch_spdt"}
+SWITCH_TYPES = frozenset({"switch", "switch_spst", "switch_spdt"})
+TERMINAL_SIDES: Tuple[str, ...] = ("left", "right", "top", "bottom")
+MIX_COLOR_CACHE_SIZE = 1024
+# (idle, fully energized) schematic colours as packed 0xRRGGBB values.
+BATTERY_CASING_COLORS = (0xfcd34d, 0xf59e0b)
+BATTERY_CELL_COLORS = (0xfda4af, 0xf87171)
+BATTERY_LEAD_COLORS = (0x64748b, 0x047857)
+RESISTOR_LEAD_COLORS = (0x475569, 0x0f766e)
+RESISTOR_BODY_COLORS = (0xfbbf24, 0xf97316)
+BULB_GLOW_COLORS = (0xf3f4f6, 0xfde68a)
+BULB_OUTLINE_COLORS = (0xcbd5f5, 0xfacc15)
+BULB_FILAMENT_COLORS = (0x64748b, 0xb45309)
+SWITCH_LEAD_COLORS = (0x64748b, 0x2563eb)
+WIRE_COLORS = (0x64748b, 0x10b981)
+# Shared bindtag carrying the pointer bindings for every widget inside a component.
+DRAG_BINDTAG = "CircuitComponentDrag"
+DRAG_BINDINGS: Tuple[Tuple[str, str], ...] = (
+    ("<Button-1>", "_on_press"),
+    ("<B1-Motion>", "_on_drag"),
+    ("<ButtonRelease-1>", "_on_release"),
+    ("<Double-Button-1>", "_on_double_click"),
+    ("<Button-3>", "_on_right_click"),
+)
+# Tk widget path -> owning component, used to route events raised on the shared bindtag.
+WIDGET_TO_COMPONENT: Dict[str, "CircuitComponent"] = {}
+# Components that moved since the last wire flush, in move order.
+_PENDING_WIRE_NOTIFY: Dict["CircuitComponent", None] = {}
+_wire_flush_scheduled = False
+
+
+@lru_cache(maxsize=None)
+def _color_hex(color: int) -> str:
+    # Format a packed 0xRRGGBB colour as the "#rrggbb" string Tk expects.
+    return "#%06x" % color
+
+
+def _component_event_handler(method: str) -> Callable[[tk.Event], None]:
+    # Build a bindtag callback that forwards the event to the component owning the widget.
+    def handler(event: tk.Event) -> None:
+        component = WIDGET_TO_COMPONENT.get(str(event.widget))
+        if component is not None:
+            getattr(component, method)(event)
+
+    return handler
+
+
+def _ensure_drag_bindtag(widget: tk.Misc) -> None:
+    # Register the shared drag bindings once per Tk interpreter.
+    if widget.bind_class(DRAG_BINDTAG):
+        return
+    for sequence, method in DRAG_BINDINGS:
+        widget.bind_class(DRAG_BINDTAG, sequence, _component_event_handler(method))
+
+
+def flush_pending_wire_updates() -> None:
+    # Bring the wires of every moved component up to date, visiting each attached wire once per component.
+    global _wire_flush_scheduled
+    _wire_flush_scheduled = False
+    pending = list(_PENDING_WIRE_NOTIFY)
+    _PENDING_WIRE_NOTIFY.clear()
+    for component in pending:
+        if component.frame is None:
+            continue
+        wires: Dict["CircuitWire", None] = {}
+        for side_wires in component.connected_wires.values():
+            wires.update(dict.fromkeys(side_wires))
+        for wire in wires:
+            wire.follow_component(component)
+
+
+@lru_cache(maxsize=MIX_COLOR_CACHE_SIZE)
+def _mix_color(start: int, end: int, ratio: float) -> str:
+    # Blend two packed colours channel by channel; idle components repeat the same few blends.
+    ratio = max(0.0, min(ratio, 1.0))
+    blended = 0
+    for shift in (16, 8, 0):
+        start_channel = start >> shift & 0xFF
+        end_channel = end >> shift & 0xFF
+        blended = blended << 8 | int(start_channel + (end_channel - start_channel) * ratio)
+    return _color_hex(blended)
 
 
 class CircuitComponent:
@@ -40,6 +120,11 @@ class CircuitComponent:
         # Initialize the component widget, state, and interaction bindings.
         self.canvas = canvas
         self.type = comp_type
+        self._is_switch = comp_type in SWITCH_TYPES
+        # The type never changes, so the schematic painter is resolved once.
+        self._draw_type_visual: Callable[[bool], None] = self._DRAW_DISPATCH.get(
+            comp_type, CircuitComponent._draw_wire_visual
+        ).__get__(self)
         self.x = int(x)
         self.y = int(y)
         self.id = component_id
@@ -49,6 +134,7 @@ class CircuitComponent:
         self.on_request_remove = on_request_remove
         self.theme = theme or DEFAULT_THEME
         self.on_request_duplicate: Optional[Callable[["CircuitComponent"], None]] = None
+        self.on_anchors_changed: Optional[Callable[["CircuitComponent"], None]] = None
 
         props = COMPONENT_PROPS.get(comp_type, {})
         self.host_bg = props.get("color", "#f1f5f9")
@@ -71,11 +157,25 @@ class CircuitComponent:
         self.orientation = "horizontal"
         self.switch_closed = True
         self._context_menu: Optional[tk.Menu] = None
-        self._drag_last_ts = 0.0
-
-        self.connected_wires: Dict[str, Set["CircuitWire"]] = {side: set() for side in ("left", "right", "top", "bottom")}
+        self._pending_drag: Optional[Tuple[int, int]] = None
+        self._drag_after_id: Optional[str] = None
+        self._frame_size: Optional[Tuple[int, int]] = None
+        # Largest top-left position that keeps the component on the canvas, fixed for the duration of a drag.
+        self._drag_limits: Optional[Tuple[int, int]] = None
+        self._redraw_after_id: Optional[str] = None
+        self._redraw_deferred = False
+        self._theme_key: Optional[Tuple[str, ...]] = None
+        self._visual_key: Optional[Tuple[str, str, bool]] = None
+        self._visual_items: List[int] = []
+        self._visual_cursor = 0
+        self._visual_groups_styled: Set[str] = set()
+        self._anchor_cache: Optional[Dict[str, Tuple[float, float]]] = None
+        self._bound_widgets: List[str] = []
+
+        self.connected_wires: Dict[str, Set["CircuitWire"]] = {side: set() for side in TERMINAL_SIDES}
         self.terminal_canvases: List[tk.Canvas] = []
 
+        # Canvas position minus pointer screen position, fixed for the duration of a drag.
         self.pointer_offset_x = 0
         self.pointer_offset_y = 0
         self.dragging = False
@@ -88,6 +188,7 @@ class CircuitComponent:
             highlightthickness=0,
         )
         self.frame.configure(width=self.base_width, height=self.base_height)
+        self.frame.bind("<Configure>", self._on_frame_configure, add="+")
 
         self.toolbar_frame = tk.Frame(self.frame, bg=self.host_bg)
         self.toolbar_frame.pack(fill=tk.X, padx=8, pady=(8, 0))
@@ -150,10 +251,10 @@ class CircuitComponent:
         self.detail_label.pack(fill=tk.X, pady=(6, 0))
 
         self._draw_terminal_indicators()
-        self._draw_visual_representation()
-        self._update_detail_text()
-        self._build_context_menu()
+        # The context menu is built on the first right-click; most components never open it.
         self.apply_theme(self.theme)
+        # Queue the first schematic and detail text draw; update_idletasks below flushes it.
+        self._request_redraw()
 
         self.frame.update_idletasks()
         self.window_id = self.canvas.create_window(
@@ -176,12 +277,12 @@ class CircuitComponent:
         ]
         if self.visual_canvas:
             bind_targets.append(self.visual_canvas)
+        _ensure_drag_bindtag(self.frame)
         for widget in bind_targets:
-            widget.bind("<Button-1>", self._on_press, add="+")
-            widget.bind("<B1-Motion>", self._on_drag, add="+")
-            widget.bind("<ButtonRelease-1>", self._on_release, add="+")
-            widget.bind("<Double-Button-1>", self._on_double_click, add="+")
-            widget.bind("<Button-3>", self._on_right_click, add="+")
+            widget.bindtags(widget.bindtags() + (DRAG_BINDTAG,))
+            path = str(widget)
+            WIDGET_TO_COMPONENT[path] = self
+            self._bound_widgets.append(path)
 
     def _component_detail_text(self) -> str:
         # Provide a human-readable description summarizing the component state.
@@ -223,6 +324,10 @@ class CircuitComponent:
         if self.active:
             badge_bg = theme.accent
             badge_fg = theme.accent_text
+        theme_key = (bg, theme.border, badge_bg, badge_fg, fg_primary, fg_secondary)
+        if theme_key == self._theme_key:
+            return
+        self._theme_key = theme_key
         if self.frame:
             self.frame.configure(bg=bg, highlightbackground=theme.border)
         if self.toolbar_frame:
@@ -239,7 +344,6 @@ class CircuitComponent:
             self.visual_canvas.configure(bg=bg)
         for dot in self.terminal_canvases:
             dot.configure(bg=bg)
-        self._draw_visual_representation()
 
     def _build_context_menu(self) -> None:
         # Configure the context menu actions for the component.
@@ -272,15 +376,20 @@ class CircuitComponent:
     def toggle_lock(self) -> None:
         # Toggle whether the component can be dragged on the canvas.
         self.locked = not self.locked
-        self._build_context_menu()
+        # The lock entry's label changed; rebuild the menu the next time it is opened.
+        if self._context_menu:
+            self._context_menu.destroy()
+            self._context_menu = None
         self.apply_theme(self.theme)
 
     def rotate(self) -> None:
         # Switch the component orientation and redraw terminals and visuals.
         self.orientation = "vertical" if self.orientation == "horizontal" else "horizontal"
+        self._invalidate_anchors()
         self._draw_terminal_indicators()
         self._notify_attached_wires()
         self.apply_theme(self.theme)
+        self._request_redraw()
 
     def duplicate(self) -> None:
         # Request a duplicate of this component via the provided callback.
@@ -292,16 +401,14 @@ class CircuitComponent:
         self.operating_current = 0.0
         self.operating_voltage = 0.0
         self.operating_power = 0.0
-        self._update_detail_text()
-        self._draw_visual_representation()
+        self._request_redraw()
 
     def update_operating_metrics(self, current: float, voltage: float, power: float) -> None:
         # Store and display operating metrics computed by the analyzer.
         self.operating_current = max(current, 0.0)
         self.operating_voltage = max(voltage, 0.0)
         self.operating_power = max(power, 0.0)
-        self._update_detail_text()
-        self._draw_visual_representation()
+        self._request_redraw()
 
     def _nominal_reference(self) -> float:
         # Derive a reference power/current level for intensity visualization.
@@ -325,28 +432,6 @@ class CircuitComponent:
             ratio = 0.0
         return max(0.0, min(ratio, 1.0))
 
-    @staticmethod
-    def _hex_to_rgb(value: str) -> Tuple[int, int, int]:
-        # Convert a hexadecimal color string into RGB tuple form.
-        value = value.lstrip("#")
-        return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
-
-    @staticmethod
-    def _rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
-        # Convert an RGB tuple back into a hexadecimal color string.
-        return "#" + "".join(f"{channel:02x}" for channel in rgb)
-
-    def _mix_color(self, start_hex: str, end_hex: str, ratio: float) -> str:
-        # Blend two colors together based on the provided ratio.
-        ratio = max(0.0, min(ratio, 1.0))
-        start_rgb = self._hex_to_rgb(start_hex)
-        end_rgb = self._hex_to_rgb(end_hex)
-        blended = tuple(
-            int(start_channel + (end_channel - start_channel) * ratio)
-            for start_channel, end_channel in zip(start_rgb, end_rgb)
-        )
-        return self._rgb_to_hex(blended)
-
     def _visual_base_dimensions(self) -> tuple[int, int]:
         # Supply the default width and height for the visual canvas.
         return 120, 80
@@ -358,40 +443,24 @@ class CircuitComponent:
             return width, height
         return height, width
 
-    def _transform_point(self, x: float, y: float) -> tuple[float, float]:
-        # Rotate a point if the component is in vertical orientation.
+    def _transform_coords(self, coords: Sequence[float]) -> Sequence[float]:
+        # Apply orientation transforms to a flat sequence of coordinate pairs.
         if self.orientation == "horizontal":
-            return x, y
-        base_width, base_height = self._visual_base_dimensions()
-        vert_width, vert_height = base_height, base_width
-        cx_base, cy_base = base_width / 2.0, base_height / 2.0
-        dx = x - cx_base
-        dy = y - cy_base
-        x_rot = -dy
-        y_rot = dx
-        cx_vert, cy_vert = vert_width / 2.0, vert_height / 2.0
-        return cx_vert + x_rot, cy_vert + y_rot
-
-    def _transform_coords(self, coords: List[float]) -> List[float]:
-        # Apply orientation transforms to a list of coordinate pairs.
+            return coords
+        # A quarter turn about the drawing centre lands (x, y) at (base_height - y, x) in the vertical frame.
+        flip = self._visual_base_dimensions()[1]
         transformed: List[float] = []
         for x, y in zip(coords[0::2], coords[1::2]):
-            tx, ty = self._transform_point(x, y)
-            transformed.extend([tx, ty])
+            transformed += (flip - y, x)
         return transformed
 
     def _transform_box(self, box: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
         # Adjust a bounding box to account for the current orientation.
         x1, y1, x2, y2 = box
-        corners = [
-            self._transform_point(x1, y1),
-            self._transform_point(x1, y2),
-            self._transform_point(x2, y1),
-            self._transform_point(x2, y2),
-        ]
-        xs = [pt[0] for pt in corners]
-        ys = [pt[1] for pt in corners]
-        return min(xs), min(ys), max(xs), max(ys)
+        if self.orientation == "horizontal":
+            return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+        flip = self._visual_base_dimensions()[1]
+        return flip - max(y1, y2), min(x1, x2), flip - min(y1, y2), max(x1, x2)
 
     def _transform_angle(self, angle: float) -> float:
         # Rotate an angle when drawing arcs in vertical orientation.
@@ -399,78 +468,100 @@ class CircuitComponent:
             return angle
         return (angle + 90.0) % 360.0
 
-    def _vc_line(self, coords: List[float], **kwargs: object) -> None:
-        # Draw a line on the visual canvas respecting orientation.
+    def _vc_item(
+        self,
+        kind: str,
+        transform: Callable,
+        shape: Sequence[float],
+        tag: Optional[str] = None,
+        **kwargs: object,
+    ) -> None:
+        # Create the next schematic item, or restyle the item drawn at this position for the same layout.
+        # Item geometry only depends on the layout, so reused items keep their coordinates.
+        # Items sharing a tag must share their style; the first of them restyles the whole group in one call.
         if not self.visual_canvas:
             return
-        transformed = self._transform_coords(coords)
-        self.visual_canvas.create_line(*transformed, **kwargs)
+        if self._visual_cursor < len(self._visual_items):
+            if tag is None:
+                self.visual_canvas.itemconfigure(self._visual_items[self._visual_cursor], **kwargs)
+            elif tag not in self._visual_groups_styled:
+                self._visual_groups_styled.add(tag)
+                self.visual_canvas.itemconfigure(tag, **kwargs)
+        else:
+            create = getattr(self.visual_canvas, f"create_{kind}")
+            if tag is not None:
+                kwargs["tags"] = (tag,)
+            self._visual_items.append(create(*transform(shape), **kwargs))
+        self._visual_cursor += 1
+
+    def _vc_line(self, coords: List[float], **kwargs: object) -> None:
+        # Draw a line on the visual canvas respecting orientation.
+        self._vc_item("line", self._transform_coords, coords, **kwargs)
 
     def _vc_rectangle(self, box: tuple[float, float, float, float], **kwargs: object) -> None:
         # Draw a rectangle on the visual canvas with orientation adjustments.
-        if not self.visual_canvas:
-            return
-        transformed = self._transform_box(box)
-        self.visual_canvas.create_rectangle(*transformed, **kwargs)
+        self._vc_item("rectangle", self._transform_box, box, **kwargs)
 
     def _vc_oval(self, box: tuple[float, float, float, float], **kwargs: object) -> None:
         # Render an oval respecting the current orientation.
-        if not self.visual_canvas:
-            return
-        transformed = self._transform_box(box)
-        self.visual_canvas.create_oval(*transformed, **kwargs)
+        self._vc_item("oval", self._transform_box, box, **kwargs)
 
     def _vc_arc(self, box: tuple[float, float, float, float], start: float, extent: float, **kwargs: object) -> None:
         # Draw an arc on the visual canvas with adjusted angles.
-        if not self.visual_canvas:
-            return
-        transformed_box = self._transform_box(box)
-        start_angle = self._transform_angle(start)
-        self.visual_canvas.create_arc(*transformed_box, start=start_angle, extent=extent, **kwargs)
+        self._vc_item("arc", self._transform_box, box, start=self._transform_angle(start), extent=extent, **kwargs)
 
     def _vc_polygon(self, coords: List[float], **kwargs: object) -> None:
         # Render a polygon with orientation-aware coordinates.
-        if not self.visual_canvas:
-            return
-        transformed = self._transform_coords(coords)
-        self.visual_canvas.create_polygon(*transformed, **kwargs)
+        self._vc_item("polygon", self._transform_coords, coords, **kwargs)
 
     def _vc_text(self, x: float, y: float, **kwargs: object) -> None:
         # Place text onto the visual canvas after transforming the point.
-        if not self.visual_canvas:
+        self._vc_item("text", self._transform_coords, (x, y), **kwargs)
+
+    def _request_redraw(self) -> None:
+        # Queue one refresh of the detail text and schematic for when Tk is idle, absorbing repeated requests.
+        if self._redraw_after_id is None and self.frame is not None:
+            self._redraw_after_id = self.frame.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        # Apply the refresh queued by _request_redraw.
+        self._redraw_after_id = None
+        if self.frame is None:
             return
-        tx, ty = self._transform_point(x, y)
-        self.visual_canvas.create_text(tx, ty, **kwargs)
+        # Repaints wait for the drop while dragging; only the window position and wires track the pointer.
+        if self.dragging:
+            self._redraw_deferred = True
+            return
+        self._redraw_deferred = False
+        self._update_detail_text()
+        self._draw_visual_representation()
 
     def _draw_visual_representation(self) -> None:
         # Redraw the schematic representation matching the component type.
         if not self.visual_canvas:
             return
-        self.visual_canvas.delete("all")
-        width, height = self._visual_dimensions()
-        self.visual_canvas.configure(width=width, height=height)
-        active = self.active
-        if self.type == "battery":
-            self._draw_battery_visual(active)
-        elif self.type == "resistor":
-            self._draw_resistor_visual(active)
-        elif self.type == "bulb":
-            self._draw_bulb_visual(active)
-        elif self.type in {"switch", "switch_spst", "switch_spdt"}:
-            self._draw_switch_visual(active)
-        else:
-            self._draw_wire_visual(active)
+        # Type, orientation and switch position fix which items exist and where; anything else only restyles them.
+        layout_key = (self.type, self.orientation, self.is_switch_closed())
+        if layout_key != self._visual_key:
+            self.visual_canvas.delete("all")
+            self._visual_items = []
+            self._visual_key = layout_key
+            width, height = self._visual_dimensions()
+            self.visual_canvas.configure(width=width, height=height)
+        self._visual_cursor = 0
+        self._visual_groups_styled.clear()
+        self._draw_type_visual(self.active)
 
     def _draw_battery_visual(self, active: bool) -> None:
         # Render a stylized battery, highlighting when active.
         ratio = self._intensity_ratio() if active else 0.0
-        casing_fill = self._mix_color("#fcd34d", "#f59e0b", ratio)
-        cell_fill = self._mix_color("#fda4af", "#f87171", ratio)
-        lead_color = self._mix_color("#64748b", "#047857", ratio)
+        casing_fill = _mix_color(*BATTERY_CASING_COLORS, ratio)
+        cell_fill = _mix_color(*BATTERY_CELL_COLORS, ratio)
+        lead_color = _mix_color(*BATTERY_LEAD_COLORS, ratio)
         text_color = "#1f2937"
 
-        self._vc_line([6, 40, 26, 40], fill=lead_color, width=4, capstyle=tk.ROUND)
-        self._vc_line([84, 40, 104, 40], fill=lead_color, width=4, capstyle=tk.ROUND)
+        self._vc_line([6, 40, 26, 40], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
+        self._vc_line([84, 40, 104, 40], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
         self._vc_rectangle((26, 18, 52, 62), fill=cell_fill, outline="#0f172a", width=2)
         self._vc_rectangle((52, 22, 84, 58), fill=casing_fill, outline="#0f172a", width=2)
         self._vc_text(20, 24, text="+", font=("Arial", 12, "bold"), fill=text_color)
@@ -479,22 +570,22 @@ class CircuitComponent:
 
     def _draw_resistor_visual(self, active: bool) -> None:
         ratio = self._intensity_ratio() if active else 0.0
-        lead_color = self._mix_color("#475569", "#0f766e", ratio)
-        resistor_color = self._mix_color("#fbbf24", "#f97316", ratio)
+        lead_color = _mix_color(*RESISTOR_LEAD_COLORS, ratio)
+        resistor_color = _mix_color(*RESISTOR_BODY_COLORS, ratio)
         text_color = "#0f172a"
 
-        self._vc_line([6, 40, 26, 40], fill=lead_color, width=4, capstyle=tk.ROUND)
+        self._vc_line([6, 40, 26, 40], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
         zigzag = [26, 40, 34, 28, 42, 52, 50, 28, 58, 52, 66, 28, 74, 40]
         self._vc_line(zigzag, fill=resistor_color, width=4, joinstyle=tk.ROUND)
-        self._vc_line([74, 40, 104, 40], fill=lead_color, width=4, capstyle=tk.ROUND)
+        self._vc_line([74, 40, 104, 40], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
         self._vc_text(55, 66, text=f"{self.resistance_value:.1f} Ω", font=("Arial", 10, "bold"), fill=text_color)
 
     def _draw_bulb_visual(self, active: bool) -> None:
         # Draw a light bulb graphic with glow tied to active power.
         ratio = self._intensity_ratio() if active else 0.0
-        glow_fill = self._mix_color("#f3f4f6", "#fde68a", ratio)
-        outline_color = self._mix_color("#cbd5f5", "#facc15", ratio)
-        filament_color = self._mix_color("#64748b", "#b45309", ratio)
+        glow_fill = _mix_color(*BULB_GLOW_COLORS, ratio)
+        outline_color = _mix_color(*BULB_OUTLINE_COLORS, ratio)
+        filament_color = _mix_color(*BULB_FILAMENT_COLORS, ratio)
         base_color = "#475569"
 
         self._vc_oval((18, 8, 92, 72), fill=glow_fill, outline=outline_color, width=3)
@@ -502,32 +593,40 @@ class CircuitComponent:
         self._vc_line([55, 48, 55, 66], fill=filament_color, width=3)
         self._vc_arc((34, 30, 76, 66), start=225, extent=90, style=tk.ARC, outline=filament_color, width=2)
         self._vc_arc((34, 30, 76, 66), start=45, extent=90, style=tk.ARC, outline=filament_color, width=2)
-        self._vc_rectangle((44, 66, 66, 76), fill=base_color, outline=base_color)
-        self._vc_rectangle((48, 76, 62, 82), fill=base_color, outline=base_color)
+        self._vc_rectangle((44, 66, 66, 76), tag="base", fill=base_color, outline=base_color)
+        self._vc_rectangle((48, 76, 62, 82), tag="base", fill=base_color, outline=base_color)
 
     def _draw_switch_visual(self, active: bool) -> None:
         # Illustrate the switch state and highlight when current flows.
         closed = self.is_switch_closed()
         highlight_ratio = 1.0 if active and closed else (0.0 if not closed else 0.4)
-        lead_color = self._mix_color("#64748b", "#2563eb", highlight_ratio)
+        lead_color = _mix_color(*SWITCH_LEAD_COLORS, highlight_ratio)
         contact_color = "#059669" if closed else "#475569"
-        self._vc_line([6, 40, 46, 40], fill=lead_color, width=4, capstyle=tk.ROUND)
-        self._vc_oval((42, 36, 50, 44), fill="#e2e8f0", outline=contact_color, width=2)
+        self._vc_line([6, 40, 46, 40], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
+        self._vc_oval((42, 36, 50, 44), tag="contact", fill="#e2e8f0", outline=contact_color, width=2)
         if closed:
-            self._vc_line([46, 40, 104, 40], fill=lead_color, width=4, capstyle=tk.ROUND)
+            self._vc_line([46, 40, 104, 40], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
             self._vc_text(86, 60, text="ON", font=("Arial", 8, "bold"), fill=contact_color)
         else:
-            self._vc_line([46, 40, 96, 22], fill=lead_color, width=4, capstyle=tk.ROUND)
-            self._vc_oval((96, 20, 104, 28), fill="#e2e8f0", outline=contact_color, width=2)
-            self._vc_line([96, 28, 104, 34], fill=lead_color, width=4, capstyle=tk.ROUND)
+            self._vc_line([46, 40, 96, 22], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
+            self._vc_oval((96, 20, 104, 28), tag="contact", fill="#e2e8f0", outline=contact_color, width=2)
+            self._vc_line([96, 28, 104, 34], tag="lead", fill=lead_color, width=4, capstyle=tk.ROUND)
             self._vc_text(86, 60, text="OFF", font=("Arial", 8, "bold"), fill="#b91c1c")
 
     def _draw_wire_visual(self, active: bool) -> None:
         # Draw a straight wire segment with activity-based color.
         ratio = self._intensity_ratio() if active else 0.0
-        wire_color = self._mix_color("#64748b", "#10b981", ratio)
+        wire_color = _mix_color(*WIRE_COLORS, ratio)
         self._vc_line([8, 40, 102, 40], fill=wire_color, width=5, capstyle=tk.ROUND)
 
+    # Component type -> schematic painter; unknown types draw as a plain wire.
+    _DRAW_DISPATCH: Dict[str, Callable[["CircuitComponent", bool], None]] = {
+        "battery": _draw_battery_visual,
+        "resistor": _draw_resistor_visual,
+        "bulb": _draw_bulb_visual,
+        **dict.fromkeys(SWITCH_TYPES, _draw_switch_visual),
+    }
+
     def _on_press(self, event: tk.Event) -> None:
         # Begin dragging by capturing pointer offsets and raising the widget.
         if not self.frame or self.locked:
@@ -535,41 +634,45 @@ class CircuitComponent:
         self.dragging = True
         if self.window_id is not None:
             self.canvas.tag_raise(self.window_id)
-        self.pointer_offset_x = event.x_root - self.frame.winfo_rootx()
-        self.pointer_offset_y = event.y_root - self.frame.winfo_rooty()
+        # The canvas neither moves, scrolls nor resizes mid-drag, and repaints wait for the drop, so the window
+        # follows the pointer's screen delta directly and the clamp limits are measured once per press.
+        self.pointer_offset_x = self.x - event.x_root
+        self.pointer_offset_y = self.y - event.y_root
+        self._drag_limits = self._position_limits()
 
     def _on_drag(self, event: tk.Event) -> None:
-        # Update the component position while dragging with grid snapping.
+        # Record the latest pointer position and apply it at most once per throttle interval.
         if not self.dragging or not self.frame or self.window_id is None or self.locked:
             return
-        now = time.time() * 1000
-        if now - self._drag_last_ts < DRAG_THROTTLE_MS:
+        self._pending_drag = (event.x_root, event.y_root)
+        if self._drag_after_id is None:
+            self._drag_after_id = self.frame.after(DRAG_THROTTLE_MS, self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        # Move the component to the most recent drag position with grid snapping.
+        self._drag_after_id = None
+        pending = self._pending_drag
+        self._pending_drag = None
+        if pending is None or not self.dragging or not self.frame or self.window_id is None or self.locked:
             return
-        self._drag_last_ts = now
-
-        pointer_x = self.canvas.canvasx(event.x_root - self.canvas.winfo_rootx())
-        pointer_y = self.canvas.canvasy(event.y_root - self.canvas.winfo_rooty())
-
-        target_x = pointer_x - self.pointer_offset_x
-        target_y = pointer_y - self.pointer_offset_y
-
-        snapped_x = round(target_x / GRID_SIZE) * GRID_SIZE
-        snapped_y = round(target_y / GRID_SIZE) * GRID_SIZE
-
-        width = self.frame.winfo_width() or self.frame.winfo_reqwidth()
-        height = self.frame.winfo_height() or self.frame.winfo_reqheight()
-
-        canvas_width, canvas_height = self._canvas_bounds()
-        snapped_x = int(max(0, min(snapped_x, canvas_width - width)))
-        snapped_y = int(max(0, min(snapped_y, canvas_height - height)))
-
-        self._move_to(snapped_x, snapped_y)
+        x_root, y_root = pending
+        snapped_x = (x_root + self.pointer_offset_x + HALF_GRID) // GRID_SIZE * GRID_SIZE
+        snapped_y = (y_root + self.pointer_offset_y + HALF_GRID) // GRID_SIZE * GRID_SIZE
+        self._move_to(snapped_x, snapped_y, self._drag_limits)
 
     def _on_release(self, _event: tk.Event) -> None:
-        # Finish dragging.
+        # Finish dragging, applying any motion still waiting on the throttle.
         if not self.dragging:
             return
+        if self._drag_after_id is not None and self.frame is not None:
+            self.frame.after_cancel(self._drag_after_id)
+            self._flush_drag()
         self.dragging = False
+        self._drag_limits = None
+        # Listeners inspect wire geometry, so settle it before reporting the move.
+        flush_pending_wire_updates()
+        if self._redraw_deferred:
+            self._flush_redraw()
         if self.on_change:
             self.on_change(self)
 
@@ -601,8 +704,7 @@ class CircuitComponent:
         else:
             return
 
-        self._update_detail_text()
-        self._draw_visual_representation()
+        self._request_redraw()
         if self.on_change:
             self.on_change(self)
 
@@ -611,43 +713,52 @@ class CircuitComponent:
         if not self.is_switch():
             return
         self.switch_closed = not self.switch_closed
-        self._update_detail_text()
-        self._draw_visual_representation()
+        self._request_redraw()
         if self.on_change:
             self.on_change(self)
 
     def is_switch(self) -> bool:
         # Check if this component type is considered a switch.
-        return self.type in SWITCH_TYPES
+        return self._is_switch
 
     def is_switch_closed(self) -> bool:
         # Report whether the switch contacts are currently closed.
         return not self.is_switch() or self.switch_closed
 
-    def _move_to(self, x: int, y: int) -> None:
+    def _move_to(self, x: int, y: int, limits: Optional[Tuple[int, int]] = None) -> None:
         # Move the component window to a clamped canvas position.
         if self.window_id is None:
             return
         if self.frame is None:
             return
-        width = self.frame.winfo_width() or self.frame.winfo_reqwidth()
-        height = self.frame.winfo_height() or self.frame.winfo_reqheight()
-        canvas_width, canvas_height = self._canvas_bounds()
-        clamped_x = int(max(0, min(x, canvas_width - width)))
-        clamped_y = int(max(0, min(y, canvas_height - height)))
+        max_x, max_y = limits or self._position_limits()
+        clamped_x = int(max(0, min(x, max_x)))
+        clamped_y = int(max(0, min(y, max_y)))
+        # Drag samples inside one grid cell, or pinned against an edge, land on the current spot; leave the window be.
+        if clamped_x == self.x and clamped_y == self.y:
+            return
         self.x = clamped_x
         self.y = clamped_y
+        self._invalidate_anchors()
         self.canvas.coords(self.window_id, self.x, self.y)
-        self._notify_attached_wires()
+        self._queue_wire_update()
 
     def _current_dimensions(self) -> tuple[int, int]:
-        # Measure the current widget size to aid placement.
+        # Measure the current widget size to aid placement, preferring the size reported by <Configure>.
         if self.frame is None:
             return self.base_width, self.base_height
+        if self._frame_size is not None:
+            return self._frame_size
         width = self.frame.winfo_width() or self.frame.winfo_reqwidth() or self.base_width
         height = self.frame.winfo_height() or self.frame.winfo_reqheight() or self.base_height
         return int(width), int(height)
 
+    def _position_limits(self) -> tuple[int, int]:
+        # Return the largest x and y the component's top-left corner may take while staying on the canvas.
+        width, height = self._current_dimensions()
+        canvas_width, canvas_height = self._canvas_bounds()
+        return canvas_width - width, canvas_height - height
+
     def _canvas_bounds(self) -> tuple[int, int]:
         # Look up the canvas width and height for boundary clamping.
         width = int(self.canvas.winfo_width() or self.canvas.winfo_reqwidth() or CANVAS_WIDTH)
@@ -659,29 +770,50 @@ class CircuitComponent:
         width, height = self._current_dimensions()
         return self.x + width / 2, self.y + height / 2
 
+    def _on_frame_configure(self, event: tk.Event) -> None:
+        # Remember the frame's new size and forget terminal coordinates derived from the old one.
+        if event.width and event.height:
+            self._frame_size = (int(event.width), int(event.height))
+        self._invalidate_anchors()
+
+    def _invalidate_anchors(self) -> None:
+        # Forget cached terminal coordinates and let the owner know its terminal index is out of date.
+        self._anchor_cache = None
+        if self.on_anchors_changed:
+            self.on_anchors_changed(self)
+
+    def anchor_points(self) -> Dict[str, Tuple[float, float]]:
+        # Return the connection points for every side, computed once per placement.
+        anchors = self._anchor_cache
+        if anchors is None:
+            width, height = self._current_dimensions()
+            left = float(self.x)
+            top = float(self.y)
+            right = float(self.x + width)
+            bottom = float(self.y + height)
+            mid_x = float(self.x + width / 2)
+            mid_y = float(self.y + height / 2)
+            if self.orientation == "vertical":
+                anchors = {
+                    "left": (mid_x, top),
+                    "right": (mid_x, bottom),
+                    "top": (left, mid_y),
+                    "bottom": (right, mid_y),
+                }
+            else:
+                anchors = {
+                    "left": (left, mid_y),
+                    "right": (right, mid_y),
+                    "top": (mid_x, top),
+                    "bottom": (mid_x, bottom),
+                }
+            self._anchor_cache = anchors
+        return anchors
+
     def anchor_point(self, side: str) -> tuple[float, float]:
         # Provide the connection point coordinates for a given side.
-        width, height = self._current_dimensions()
-        cy = self.y + height / 2
-        if self.orientation == "vertical":
-            if side == "left":
-                return float(self.x + width / 2), float(self.y)
-            if side == "right":
-                return float(self.x + width / 2), float(self.y + height)
-            if side == "top":
-                return float(self.x), float(cy)
-            if side == "bottom":
-                return float(self.x + width), float(cy)
-        else:
-            if side == "left":
-                return float(self.x), float(cy)
-            if side == "right":
-                return float(self.x + width), float(cy)
-            if side == "top":
-                return float(self.x + width / 2), float(self.y)
-            if side == "bottom":
-                return float(self.x + width / 2), float(self.y + height)
-        return self.center()
+        anchor = self.anchor_points().get(side)
+        return anchor if anchor is not None else self.center()
 
     def get_resistance(self) -> float:
         # Return the configured resistance value for this component.
@@ -701,8 +833,18 @@ class CircuitComponent:
             self.canvas.delete(self.window_id)
             self.window_id = None
         if self.frame is not None:
+            if self._drag_after_id is not None:
+                self.frame.after_cancel(self._drag_after_id)
+                self._drag_after_id = None
+            if self._redraw_after_id is not None:
+                self.frame.after_cancel(self._redraw_after_id)
+                self._redraw_after_id = None
+            for path in self._bound_widgets:
+                WIDGET_TO_COMPONENT.pop(path, None)
+            self._bound_widgets.clear()
             self.frame.destroy()
             self.frame = None
+            self._anchor_cache = None
         if self.on_request_remove:
             self.on_request_remove(self)
 
@@ -720,8 +862,10 @@ class CircuitComponent:
             for item in dot.find_withtag("terminal"):
                 dot.itemconfigure(item, fill=connector_color, outline=connector_color)
 
+        # The frame border was just recoloured directly, so the cached theme colours no longer describe it.
+        self._theme_key = None
         self.apply_theme(self.theme)
-        self._update_detail_text()
+        self._request_redraw()
 
     def attach_wire(self, wire: "CircuitWire", side: str) -> None:
         # Track wires connected to the given terminal side.
@@ -739,6 +883,14 @@ class CircuitComponent:
             for wires in self.connected_wires.values():
                 wires.discard(wire)
 
+    def _queue_wire_update(self) -> None:
+        # Defer moving attached wires to one idle flush shared by every component that moved.
+        global _wire_flush_scheduled
+        _PENDING_WIRE_NOTIFY[self] = None
+        if not _wire_flush_scheduled:
+            _wire_flush_scheduled = True
+            self.canvas.after_idle(flush_pending_wire_updates)
+
     def _notify_attached_wires(self) -> None:
         # Update connected wires with new anchor coordinates.
         for side, wires in self.connected_wires.items():
@@ -753,4 +905,4 @@ class CircuitComponent:
         self.terminal_canvases.clear()
 
 
-__all__ = ["CircuitComponent"]
+__all__ = ["CircuitComponent", "SWITCH_TYPES", "TERMINAL_SIDES", "flush_pending_wire_updates"]
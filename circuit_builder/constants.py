@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict
 
 GRID_SIZE = 20
+HALF_GRID = GRID_SIZE // 2
 CANVAS_WIDTH = 1080
 CANVAS_HEIGHT = 640
 
@@ -99,6 +100,7 @@ BATTERY_VOLTAGE = 9.0
 
 __all__ = [
     "GRID_SIZE",
+    "HALF_GRID",
     "CANVAS_WIDTH",
     "CANVAS_HEIGHT",
     "COMPONENT_ICONS",
@@ -26,6 +26,8 @@ ConnectorFinder = Callable[[float, float, Optional["CircuitWire"], Optional[str]
 PointId = str
 LinkRef = Tuple["CircuitWire", PointId]
 VisitedSet = Set[LinkRef]
+# (ax, ay, bx, by, dx, dy, length_sq) for one straight run of the wire path.
+PathSegment = Tuple[float, float, float, float, float, float, float]
 ENDPOINT_IDS: Tuple[PointId, PointId] = ("a", "b")
 ENDPOINT_RADIUS = 7
 JOINT_RADIUS = 6
@@ -93,6 +95,9 @@ class CircuitWire:
         self.joint_ids: List[PointId] = []
         self.joint_handles: Dict[PointId, Optional[int]] = {}
         self._joint_counter = 0
+        self._path_cache: Optional[Tuple[Tuple[float, float], ...]] = None
+        self._path_bounds: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+        self._path_segments: Tuple[PathSegment, ...] = ()
         self._dragging_joint_id: Optional[PointId] = None
 
         self._dragging_endpoint: Optional[str] = None
@@ -126,6 +131,7 @@ class CircuitWire:
     def _set_point(self, point_id: PointId, x: float, y: float, *, update_path: bool = True) -> None:
         # Update the stored coordinates for a point and move its handle.
         self.positions[point_id] = (x, y)
+        self._path_cache = None
         handle_id = self.point_handles.get(point_id)
         if handle_id:
             radius = ENDPOINT_RADIUS if point_id in ENDPOINT_IDS else JOINT_RADIUS
@@ -134,12 +140,22 @@ class CircuitWire:
         if update_path:
             self._update_line_path()
 
-    def _path_points(self) -> List[Tuple[float, float]]:
-        # Return the ordered list of points that define the wire path.
-        points: List[Tuple[float, float]] = []
-        for point_id in self._all_point_ids():
-            points.append(self.positions[point_id])
-        return points
+    def _path_points(self) -> Tuple[Tuple[float, float], ...]:
+        # Return the ordered points that define the wire path, reusing them until a point moves or is added/removed.
+        if self._path_cache is None:
+            positions = self.positions
+            points = tuple(positions[point_id] for point_id in self._all_point_ids())
+            xs = [px for px, _py in points]
+            ys = [py for _px, py in points]
+            self._path_bounds = (min(xs), min(ys), max(xs), max(ys))
+            segments: List[PathSegment] = []
+            for (ax, ay), (bx, by) in zip(points, points[1:]):
+                dx = bx - ax
+                dy = by - ay
+                segments.append((ax, ay, bx, by, dx, dy, dx * dx + dy * dy))
+            self._path_segments = tuple(segments)
+            self._path_cache = points
+        return self._path_cache
 
     def _update_line_path(self) -> None:
         # Refresh the line geometry to match current point positions.
@@ -166,6 +182,7 @@ class CircuitWire:
         else:
             self.joint_ids.insert(max(0, min(insert_at, len(self.joint_ids))), joint_id)
         self.positions[joint_id] = point
+        self._path_cache = None
         self.attachments[joint_id] = None
         self.links[joint_id] = set()
         handle: Optional[int] = None
@@ -229,6 +246,7 @@ class CircuitWire:
             self.canvas.delete(handle)
         self.point_handles.pop(joint_id, None)
         self.positions.pop(joint_id, None)
+        self._path_cache = None
         self.attachments.pop(joint_id, None)
         self.links.pop(joint_id, None)
         self.joint_ids.remove(joint_id)
@@ -327,10 +345,20 @@ class CircuitWire:
                 selected = endpoint
         return selected
 
-    def path_points(self) -> List[Tuple[float, float]]:
-        # Expose the path coordinates for external consumers.
+    def path_points(self) -> Tuple[Tuple[float, float], ...]:
+        # Expose the cached path coordinates for external consumers.
         return self._path_points()
 
+    def path_bounds(self) -> Tuple[float, float, float, float]:
+        # Return the (min_x, min_y, max_x, max_y) box enclosing the whole path.
+        self._path_points()
+        return self._path_bounds
+
+    def path_segments(self) -> Tuple[PathSegment, ...]:
+        # Return the path as consecutive segments with their deltas and squared lengths precomputed.
+        self._path_points()
+        return self._path_segments
+
     def _propagate_attachment(
         self,
         point_id: PointId,
@@ -478,16 +506,21 @@ class CircuitWire:
         # Move linked points to follow a component that has moved.
         for point_id, attachment in self.attachments.items():
             if attachment and attachment[0] is component and attachment[1] == side:
-                self._set_point(point_id, *point)
+                # _propagate_position redraws this wire's path once the linked points have moved.
+                self._set_point(point_id, *point, update_path=False)
+                self._propagate_position(point_id, point, {(self, point_id)})
+
+    def follow_component(self, component: ComponentLike) -> None:
+        # Move every point attached to the component onto its current terminal anchors.
+        for point_id, attachment in self.attachments.items():
+            if attachment and attachment[0] is component:
+                point = component.anchor_point(attachment[1])
+                self._set_point(point_id, *point, update_path=False)
                 self._propagate_position(point_id, point, {(self, point_id)})
 
     def attached_components(self) -> list[ComponentLike]:
-        # Return unique components currently connected to this wire.
-        components: Set[ComponentLike] = set()
-        for attachment in self.attachments.values():
-            if attachment:
-                components.add(attachment[0])
-        return list(components)
+        # Return unique components currently connected to this wire, in endpoint order.
+        return list(dict.fromkeys(attachment[0] for attachment in self.attachments.values() if attachment))
 
     def set_active(self, active: bool) -> None:
         # Update wire visuals to reflect whether it carries current.
@@ -562,4 +595,4 @@ class CircuitWire:
             self.on_change(self)
 
 
-__all__ = ["CircuitWire"]
+__all__ = ["CircuitWire", "ENDPOINT_IDS"]